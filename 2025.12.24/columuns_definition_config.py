@@ -1,14 +1,22 @@
 from __future__ import annotations
 
-import json
+import sys
 from dataclasses import dataclass
+from functools import cache, lru_cache
+from itertools import chain
 from pathlib import Path
-from typing import Any, Dict, Iterable, Optional, Sequence, Tuple
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Iterator, Mapping, Optional, Sequence, Tuple
 
-from financial_mapping import MappingConfig
+from financial_mapping import MappingConfig, compile_pattern
 
+try:
+    import orjson
+except ImportError:  # optional; the stdlib json module produces the same objects
+    orjson = None
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class MappingItemSpec:
     """Declarative spec for a canonical item override."""
 
@@ -20,338 +28,375 @@ class MappingItemSpec:
     tag_exact: Tuple[str, ...] = ()
     label_regex: Tuple[str, ...] = ()
 
+    def __post_init__(self) -> None:
+        # Keys and element names recur across banks; share one string object for each.
+        object.__setattr__(self, "canonical_key", sys.intern(self.canonical_key))
+        object.__setattr__(self, "statement", sys.intern(self.statement))
+        object.__setattr__(self, "element_exact", tuple(sys.intern(value) for value in self.element_exact))
+
+
+# Candidate dicts shared across override banks, keyed by (field, kind, value, weight).
+# The same dict object can appear in several banks, so treat candidates as read-only.
+_CANDIDATE_INTERN: Dict[Tuple[str, str, str, float], Dict[str, Any]] = {}
+
+
+def _intern_candidate(field: str, kind: str, value: str, weight: float) -> Dict[str, Any]:
+    """Return the shared candidate dict for the given match definition."""
+    key = (sys.intern(field), kind, sys.intern(value), weight)
+    candidate = _CANDIDATE_INTERN.get(key)
+    if candidate is None:
+        candidate = {"field": key[0], kind: key[2], "weight": weight}
+        _CANDIDATE_INTERN[key] = candidate
+    return candidate
+
+
+@cache
+def _weight_ladder(base_weight: float, count: int) -> Tuple[float, ...]:
+    """Return descending candidate weights stepping down by 0.1 from the base."""
+    return tuple(round(base_weight - (idx * 0.1), 3) for idx in range(count))
+
+
+def _candidate_dicts(field: str, kind: str, values: Sequence[str], base_weight: float) -> Iterator[Dict[str, Any]]:
+    """Yield candidates of one match kind with descending weights."""
+    for value, weight in zip(values, _weight_ladder(base_weight, len(values))):
+        if kind == "regex":
+            # Compile up front so bad patterns fail at build time and matchers reuse the cached object.
+            compile_pattern(value)
+        yield _intern_candidate(field, kind, value, weight)
+
 
 def build_mapping_override(items: Sequence[MappingItemSpec]) -> Dict[str, Any]:
     """Build a mapping dict from ordered item specs."""
-    mapping_items: list[Dict[str, Any]] = []
-
-    for item in items:
-        candidates: list[Dict[str, Any]] = []
-
-        def _append_exact(field: str, values: Iterable[str], base_weight: float) -> None:
-            """Append exact-match candidates with descending weights."""
-            for idx, value in enumerate(values):
-                candidates.append(
-                    {
-                        "field": field,
-                        "exact": value,
-                        "weight": round(base_weight - (idx * 0.1), 3),
-                    }
-                )
-
-        def _append_regex(field: str, values: Iterable[str], base_weight: float) -> None:
-            """Append regex-match candidates with descending weights."""
-            for idx, value in enumerate(values):
-                candidates.append(
-                    {
-                        "field": field,
-                        "regex": value,
-                        "weight": round(base_weight - (idx * 0.1), 3),
-                    }
-                )
-
-        _append_exact("element", item.element_exact, base_weight=4.0)
-        _append_exact("tag", item.tag_exact, base_weight=3.0)
-        _append_regex("element", item.element_regex, base_weight=2.5)
-        _append_regex("label", item.label_regex, base_weight=1.5)
-
-        mapping_items.append(
+    return {
+        "version": 1,
+        "items": tuple(
             {
                 "canonical_key": item.canonical_key,
                 "statement": item.statement,
                 "period_type": item.period_type,
-                "candidates": candidates,
+                "candidates": tuple(
+                    chain(
+                        _candidate_dicts("element", "exact", item.element_exact, base_weight=4.0),
+                        _candidate_dicts("tag", "exact", item.tag_exact, base_weight=3.0),
+                        _candidate_dicts("element", "regex", item.element_regex, base_weight=2.5),
+                        _candidate_dicts("label", "regex", item.label_regex, base_weight=1.5),
+                    )
+                ),
             }
-        )
+            for item in items
+        ),
+    }
 
-    return {"version": 1, "items": mapping_items}
-
-
-_IFRS_OVERRIDES = build_mapping_override(
-    [
-        MappingItemSpec(
-            canonical_key="Revenue",
-            statement="PL",
-            period_type="duration",
-            element_exact=(
-                "RevenueIFRSSummaryOfBusinessResults",
-                "RevenueIFRS",
-                "NetSalesIFRS",
-                "SalesRevenuesIFRS",
-                "TotalNetRevenuesIFRS",
-                "OperatingRevenuesIFRSKeyFinancialData",
-                "OperatingRevenueFromExternalCustomersIFRS",
-                "NetSalesSummaryOfBusinessResults",
-            ),
-            element_regex=(
-                r"SalesRevenueNet",
-                r"OperatingRevenue",
+
+@cache
+def ifrs_overrides() -> Dict[str, Any]:
+    """Return the IFRS override bank, built on first use."""
+    return build_mapping_override(
+        [
+            MappingItemSpec(
+                canonical_key="Revenue",
+                statement="PL",
+                period_type="duration",
+                element_exact=(
+                    "RevenueIFRSSummaryOfBusinessResults",
+                    "RevenueIFRS",
+                    "NetSalesIFRS",
+                    "SalesRevenuesIFRS",
+                    "TotalNetRevenuesIFRS",
+                    "OperatingRevenuesIFRSKeyFinancialData",
+                    "OperatingRevenueFromExternalCustomersIFRS",
+                    "NetSalesSummaryOfBusinessResults",
+                ),
+                element_regex=(
+                    r"SalesRevenueNet",
+                    r"OperatingRevenue",
+                ),
+                label_regex=(r"\b(Revenue|Net Sales|Sales Revenue|Operating Revenue)\b",),
             ),
-            label_regex=(r"\\b(Revenue|Net Sales|Sales Revenue|Operating Revenue)\\b",),
-        ),
-        MappingItemSpec(
-            canonical_key="OperatingIncome",
-            statement="PL",
-            period_type="duration",
-            element_exact=(
-                "OperatingProfitLossIFRSSummaryOfBusinessResults",
-                "OperatingProfitLossIFRS",
-                "OperatingIncome",
-                "OperatingProfit",
+            MappingItemSpec(
+                canonical_key="OperatingIncome",
+                statement="PL",
+                period_type="duration",
+                element_exact=(
+                    "OperatingProfitLossIFRSSummaryOfBusinessResults",
+                    "OperatingProfitLossIFRS",
+                    "OperatingIncome",
+                    "OperatingProfit",
+                ),
+                element_regex=(r"OperatingIncomeSummaryOfBusinessResults",),
+                label_regex=(r"Operating (Income|Profit)",),
             ),
-            element_regex=(r"OperatingIncomeSummaryOfBusinessResults",),
-            label_regex=(r"Operating (Income|Profit)",),
-        ),
-        MappingItemSpec(
-            canonical_key="PretaxIncome",
-            statement="PL",
-            period_type="duration",
-            element_exact=(
-                "ProfitLossBeforeTaxIFRSSummaryOfBusinessResults",
-                "ProfitLossBeforeTaxIFRS",
-                "IncomeBeforeIncomeTaxes",
-                "IncomeBeforeIncomeTaxesIFRS",
+            MappingItemSpec(
+                canonical_key="PretaxIncome",
+                statement="PL",
+                period_type="duration",
+                element_exact=(
+                    "ProfitLossBeforeTaxIFRSSummaryOfBusinessResults",
+                    "ProfitLossBeforeTaxIFRS",
+                    "IncomeBeforeIncomeTaxes",
+                    "IncomeBeforeIncomeTaxesIFRS",
+                ),
+                element_regex=(r"ProfitLossBeforeTax",),
+                label_regex=(r"Before Tax|Pretax",),
             ),
-            element_regex=(r"ProfitLossBeforeTax",),
-            label_regex=(r"Before Tax|Pretax",),
-        ),
-        MappingItemSpec(
-            canonical_key="NetIncome",
-            statement="PL",
-            period_type="duration",
-            element_exact=(
-                "ProfitLossAttributableToOwnersOfParentIFRSSummaryOfBusinessResults",
-                "ProfitLossAttributableToOwnersOfParentIFRS",
-                "ProfitLossIFRS",
-                "ProfitLoss",
+            MappingItemSpec(
+                canonical_key="NetIncome",
+                statement="PL",
+                period_type="duration",
+                element_exact=(
+                    "ProfitLossAttributableToOwnersOfParentIFRSSummaryOfBusinessResults",
+                    "ProfitLossAttributableToOwnersOfParentIFRS",
+                    "ProfitLossIFRS",
+                    "ProfitLoss",
+                ),
+                element_regex=(r"NetIncomeLossSummaryOfBusinessResults",),
+                label_regex=(r"Net (Income|Profit)",),
             ),
-            element_regex=(r"NetIncomeLossSummaryOfBusinessResults",),
-            label_regex=(r"Net (Income|Profit)",),
-        ),
-    ]
-)
+        ]
+    )
 
 
-_JGAAP_OVERRIDES = build_mapping_override(
-    [
-        MappingItemSpec(
-            canonical_key="Revenue",
-            statement="PL",
-            period_type="duration",
-            element_exact=(
-                "NetSalesSummaryOfBusinessResults",
-                "NetSales",
-                "OperatingRevenueSummaryOfBusinessResults",
+@cache
+def jgaap_overrides() -> Dict[str, Any]:
+    """Return the JGAAP override bank, built on first use."""
+    return build_mapping_override(
+        [
+            MappingItemSpec(
+                canonical_key="Revenue",
+                statement="PL",
+                period_type="duration",
+                element_exact=(
+                    "NetSalesSummaryOfBusinessResults",
+                    "NetSales",
+                    "OperatingRevenueSummaryOfBusinessResults",
+                ),
+                element_regex=(r"SalesRevenueNet",),
+                label_regex=(r"\b(Revenue|Net Sales|Sales Revenue|Operating Revenue)\b",),
             ),
-            element_regex=(r"SalesRevenueNet",),
-            label_regex=(r"\\b(Revenue|Net Sales|Sales Revenue|Operating Revenue)\\b",),
-        ),
-        MappingItemSpec(
-            canonical_key="OperatingIncome",
-            statement="PL",
-            period_type="duration",
-            element_exact=(
-                "OperatingIncomeSummaryOfBusinessResults",
-                "OperatingIncome",
-                "OperatingProfit",
+            MappingItemSpec(
+                canonical_key="OperatingIncome",
+                statement="PL",
+                period_type="duration",
+                element_exact=(
+                    "OperatingIncomeSummaryOfBusinessResults",
+                    "OperatingIncome",
+                    "OperatingProfit",
+                ),
+                element_regex=(r"OperatingIncome",),
+                label_regex=(r"Operating (Income|Profit)",),
             ),
-            element_regex=(r"OperatingIncome",),
-            label_regex=(r"Operating (Income|Profit)",),
-        ),
-        MappingItemSpec(
-            canonical_key="PretaxIncome",
-            statement="PL",
-            period_type="duration",
-            element_exact=(
-                "ProfitLossBeforeTaxSummaryOfBusinessResults",
-                "ProfitLossBeforeTax",
-                "IncomeBeforeIncomeTaxes",
+            MappingItemSpec(
+                canonical_key="PretaxIncome",
+                statement="PL",
+                period_type="duration",
+                element_exact=(
+                    "ProfitLossBeforeTaxSummaryOfBusinessResults",
+                    "ProfitLossBeforeTax",
+                    "IncomeBeforeIncomeTaxes",
+                ),
+                element_regex=(r"ProfitLossBeforeTax|IncomeBeforeIncomeTaxes|IncomeBeforeTax",),
+                label_regex=(r"Before Tax|Pretax",),
             ),
-            element_regex=(r"ProfitLossBeforeTax|IncomeBeforeIncomeTaxes|IncomeBeforeTax",),
-            label_regex=(r"Before Tax|Pretax",),
-        ),
-        MappingItemSpec(
-            canonical_key="NetIncome",
-            statement="PL",
-            period_type="duration",
-            element_exact=(
-                "ProfitLossAttributableToOwnersOfParentSummaryOfBusinessResults",
-                "ProfitLossAttributableToOwnersOfParent",
-                "NetIncomeLossSummaryOfBusinessResults",
-                "ProfitLoss",
+            MappingItemSpec(
+                canonical_key="NetIncome",
+                statement="PL",
+                period_type="duration",
+                element_exact=(
+                    "ProfitLossAttributableToOwnersOfParentSummaryOfBusinessResults",
+                    "ProfitLossAttributableToOwnersOfParent",
+                    "NetIncomeLossSummaryOfBusinessResults",
+                    "ProfitLoss",
+                ),
+                element_regex=(r"NetIncome|NetProfit",),
+                label_regex=(r"Net (Income|Profit)",),
             ),
-            element_regex=(r"NetIncome|NetProfit",),
-            label_regex=(r"Net (Income|Profit)",),
-        ),
-    ]
-)
+        ]
+    )
 
 
-_USGAAP_OVERRIDES = build_mapping_override(
-    [
-        MappingItemSpec(
-            canonical_key="Revenue",
-            statement="PL",
-            period_type="duration",
-            element_exact=(
-                "RevenuesUSGAAPSummaryOfBusinessResults",
-                "SalesRevenueNet",
+@cache
+def usgaap_overrides() -> Dict[str, Any]:
+    """Return the US GAAP override bank, built on first use."""
+    return build_mapping_override(
+        [
+            MappingItemSpec(
+                canonical_key="Revenue",
+                statement="PL",
+                period_type="duration",
+                element_exact=(
+                    "RevenuesUSGAAPSummaryOfBusinessResults",
+                    "SalesRevenueNet",
+                ),
+                element_regex=(r"Revenue|NetSales",),
+                label_regex=(r"\b(Revenue|Net Sales|Sales Revenue)\b",),
             ),
-            element_regex=(r"Revenue|NetSales",),
-            label_regex=(r"\\b(Revenue|Net Sales|Sales Revenue)\\b",),
-        ),
-        MappingItemSpec(
-            canonical_key="OperatingIncome",
-            statement="PL",
-            period_type="duration",
-            element_exact=(
-                "OperatingIncomeSummaryOfBusinessResults",
-                "OperatingIncome",
-                "OperatingProfit",
+            MappingItemSpec(
+                canonical_key="OperatingIncome",
+                statement="PL",
+                period_type="duration",
+                element_exact=(
+                    "OperatingIncomeSummaryOfBusinessResults",
+                    "OperatingIncome",
+                    "OperatingProfit",
+                ),
+                element_regex=(r"OperatingIncome",),
+                label_regex=(r"Operating (Income|Profit)",),
             ),
-            element_regex=(r"OperatingIncome",),
-            label_regex=(r"Operating (Income|Profit)",),
-        ),
-        MappingItemSpec(
-            canonical_key="PretaxIncome",
-            statement="PL",
-            period_type="duration",
-            element_exact=(
-                "IncomeBeforeIncomeTaxesUSGAAPSummaryOfBusinessResults",
-                "IncomeBeforeIncomeTaxes",
+            MappingItemSpec(
+                canonical_key="PretaxIncome",
+                statement="PL",
+                period_type="duration",
+                element_exact=(
+                    "IncomeBeforeIncomeTaxesUSGAAPSummaryOfBusinessResults",
+                    "IncomeBeforeIncomeTaxes",
+                ),
+                element_regex=(r"IncomeBeforeTax|ProfitLossBeforeTax",),
+                label_regex=(r"Before Tax|Pretax",),
             ),
-            element_regex=(r"IncomeBeforeTax|ProfitLossBeforeTax",),
-            label_regex=(r"Before Tax|Pretax",),
-        ),
-        MappingItemSpec(
-            canonical_key="NetIncome",
-            statement="PL",
-            period_type="duration",
-            element_exact=(
-                "NetIncomeLossAttributableToOwnersOfParentUSGAAPSummaryOfBusinessResults",
-                "NetIncomeLossSummaryOfBusinessResults",
-                "NetIncomeLoss",
-                "NetIncome",
+            MappingItemSpec(
+                canonical_key="NetIncome",
+                statement="PL",
+                period_type="duration",
+                element_exact=(
+                    "NetIncomeLossAttributableToOwnersOfParentUSGAAPSummaryOfBusinessResults",
+                    "NetIncomeLossSummaryOfBusinessResults",
+                    "NetIncomeLoss",
+                    "NetIncome",
+                ),
+                element_regex=(r"ProfitLoss",),
+                label_regex=(r"Net (Income|Profit)",),
             ),
-            element_regex=(r"ProfitLoss",),
-            label_regex=(r"Net (Income|Profit)",),
-        ),
-    ]
-)
+        ]
+    )
 
 
-_MUFG_OVERRIDES = build_mapping_override(
-    [
-        MappingItemSpec(
-            canonical_key="Revenue",
-            statement="PL",
-            period_type="duration",
-            element_exact=(
-                "OrdinaryIncomeSummaryOfBusinessResults",
-                "OrdinaryIncomeBNK",
+@cache
+def mufg_overrides() -> Dict[str, Any]:
+    """Return the MUFG (JGAAP) override bank, built on first use."""
+    return build_mapping_override(
+        [
+            MappingItemSpec(
+                canonical_key="Revenue",
+                statement="PL",
+                period_type="duration",
+                element_exact=(
+                    "OrdinaryIncomeSummaryOfBusinessResults",
+                    "OrdinaryIncomeBNK",
+                ),
             ),
-        ),
-        MappingItemSpec(
-            canonical_key="OperatingIncome",
-            statement="PL",
-            period_type="duration",
-            element_exact=(
-                "OrdinaryIncomeLossSummaryOfBusinessResults",
-                "OrdinaryIncome",
+            MappingItemSpec(
+                canonical_key="OperatingIncome",
+                statement="PL",
+                period_type="duration",
+                element_exact=(
+                    "OrdinaryIncomeLossSummaryOfBusinessResults",
+                    "OrdinaryIncome",
+                ),
             ),
-        ),
-        MappingItemSpec(
-            canonical_key="NetIncome",
-            statement="PL",
-            period_type="duration",
-            element_exact=(
-                "ProfitLossAttributableToOwnersOfParentSummaryOfBusinessResults",
-                "ProfitLossAttributableToOwnersOfParent",
-                "ProfitLoss",
+            MappingItemSpec(
+                canonical_key="NetIncome",
+                statement="PL",
+                period_type="duration",
+                element_exact=(
+                    "ProfitLossAttributableToOwnersOfParentSummaryOfBusinessResults",
+                    "ProfitLossAttributableToOwnersOfParent",
+                    "ProfitLoss",
+                ),
             ),
-        ),
-    ]
-)
+        ]
+    )
 
 
-_TOYOTA_OVERRIDES = build_mapping_override(
-    [
-        MappingItemSpec(
-            canonical_key="Revenue",
-            statement="PL",
-            period_type="duration",
-            element_exact=(
-                "TotalNetRevenuesIFRS",
-                "OperatingRevenuesIFRSKeyFinancialData",
-                "SalesRevenuesIFRS",
-                "RevenuesUSGAAPSummaryOfBusinessResults",
+@cache
+def toyota_overrides() -> Dict[str, Any]:
+    """Return the Toyota (IFRS) override bank, built on first use."""
+    return build_mapping_override(
+        [
+            MappingItemSpec(
+                canonical_key="Revenue",
+                statement="PL",
+                period_type="duration",
+                element_exact=(
+                    "TotalNetRevenuesIFRS",
+                    "OperatingRevenuesIFRSKeyFinancialData",
+                    "SalesRevenuesIFRS",
+                    "RevenuesUSGAAPSummaryOfBusinessResults",
+                ),
             ),
-        ),
-        MappingItemSpec(
-            canonical_key="PretaxIncome",
-            statement="PL",
-            period_type="duration",
-            element_exact=(
-                "ProfitLossBeforeTaxIFRSSummaryOfBusinessResults",
-                "ProfitLossBeforeTaxIFRS",
-                "ProfitLossBeforeTaxUSGAAPSummaryOfBusinessResults",
+            MappingItemSpec(
+                canonical_key="PretaxIncome",
+                statement="PL",
+                period_type="duration",
+                element_exact=(
+                    "ProfitLossBeforeTaxIFRSSummaryOfBusinessResults",
+                    "ProfitLossBeforeTaxIFRS",
+                    "ProfitLossBeforeTaxUSGAAPSummaryOfBusinessResults",
+                ),
             ),
-        ),
-        MappingItemSpec(
-            canonical_key="NetIncome",
-            statement="PL",
-            period_type="duration",
-            element_exact=(
-                "ProfitLossAttributableToOwnersOfParentIFRSSummaryOfBusinessResults",
-                "ProfitLossAttributableToOwnersOfParentIFRS",
-                "NetIncomeLossAttributableToOwnersOfParentUSGAAPSummaryOfBusinessResults",
-                "NetIncomeLossSummaryOfBusinessResults",
-                "ProfitLoss",
+            MappingItemSpec(
+                canonical_key="NetIncome",
+                statement="PL",
+                period_type="duration",
+                element_exact=(
+                    "ProfitLossAttributableToOwnersOfParentIFRSSummaryOfBusinessResults",
+                    "ProfitLossAttributableToOwnersOfParentIFRS",
+                    "NetIncomeLossAttributableToOwnersOfParentUSGAAPSummaryOfBusinessResults",
+                    "NetIncomeLossSummaryOfBusinessResults",
+                    "ProfitLoss",
+                ),
             ),
-        ),
-    ]
-)
+        ]
+    )
 
 
-_HONDA_OVERRIDES = build_mapping_override(
-    [
-        MappingItemSpec(
-            canonical_key="Revenue",
-            statement="PL",
-            period_type="duration",
-            element_exact=(
-                "RevenueIFRSSummaryOfBusinessResults",
-                "RevenueIFRS",
-                "RevenuesUSGAAPSummaryOfBusinessResults",
+@cache
+def honda_overrides() -> Dict[str, Any]:
+    """Return the Honda (IFRS) override bank, built on first use."""
+    return build_mapping_override(
+        [
+            MappingItemSpec(
+                canonical_key="Revenue",
+                statement="PL",
+                period_type="duration",
+                element_exact=(
+                    "RevenueIFRSSummaryOfBusinessResults",
+                    "RevenueIFRS",
+                    "RevenuesUSGAAPSummaryOfBusinessResults",
+                ),
             ),
-        ),
-        MappingItemSpec(
-            canonical_key="PretaxIncome",
-            statement="PL",
-            period_type="duration",
-            element_exact=(
-                "ProfitLossBeforeTaxIFRSSummaryOfBusinessResults",
-                "ProfitLossBeforeTaxIFRS",
-                "ProfitLossBeforeTaxUSGAAPSummaryOfBusinessResults",
+            MappingItemSpec(
+                canonical_key="PretaxIncome",
+                statement="PL",
+                period_type="duration",
+                element_exact=(
+                    "ProfitLossBeforeTaxIFRSSummaryOfBusinessResults",
+                    "ProfitLossBeforeTaxIFRS",
+                    "ProfitLossBeforeTaxUSGAAPSummaryOfBusinessResults",
+                ),
             ),
-        ),
-        MappingItemSpec(
-            canonical_key="NetIncome",
-            statement="PL",
-            period_type="duration",
-            element_exact=(
-                "ProfitLossAttributableToOwnersOfParentIFRSSummaryOfBusinessResults",
-                "ProfitLossAttributableToOwnersOfParentIFRS",
-                "NetIncomeLossAttributableToOwnersOfParentUSGAAPSummaryOfBusinessResults",
-                "NetIncomeLossSummaryOfBusinessResults",
-                "ProfitLoss",
+            MappingItemSpec(
+                canonical_key="NetIncome",
+                statement="PL",
+                period_type="duration",
+                element_exact=(
+                    "ProfitLossAttributableToOwnersOfParentIFRSSummaryOfBusinessResults",
+                    "ProfitLossAttributableToOwnersOfParentIFRS",
+                    "NetIncomeLossAttributableToOwnersOfParentUSGAAPSummaryOfBusinessResults",
+                    "NetIncomeLossSummaryOfBusinessResults",
+                    "ProfitLoss",
+                ),
             ),
-        ),
-    ]
-)
+        ]
+    )
+
 
+def _stack_entry(name: str, color_key: str) -> Dict[str, str]:
+    """Build a chart stack entry whose data column and display name coincide."""
+    name = sys.intern(name)
+    return {"col": name, "name": name, "color_key": sys.intern(color_key)}
 
-_DEFAULT_LAYOUT: Dict[str, Any] = {
+
+_DEFAULT_LAYOUT: Mapping[str, Any] = {
     "pl_series": [
         {"canonical_key": "Revenue", "column_name": "Revenue", "color_key": "navy"},
         {"canonical_key": "OperatingIncome", "column_name": "Operating Income", "color_key": "red"},
@@ -703,143 +748,115 @@ _DEFAULT_LAYOUT: Dict[str, Any] = {
             },
         ],
         "left_stack": [
-            {"col": "Cash & Equivalents", "name": "Cash & Equivalents", "color_key": "mint"},
-            {"col": "Accounts Receivable", "name": "Accounts Receivable", "color_key": "sky_blue"},
-            {
-                "col": "Financial Services Receivables (Current)",
-                "name": "Financial Services Receivables (Current)",
-                "color_key": "cadet_blue",
-            },
-            {"col": "Inventories", "name": "Inventories", "color_key": "mustard"},
-            {"col": "Other Financial Assets (Current)", "name": "Other Financial Assets (Current)", "color_key": "cream"},
-            {"col": "Other Current Assets", "name": "Other Current Assets", "color_key": "ice_blue"},
-            {"col": "Assets Held for Sale", "name": "Assets Held for Sale", "color_key": "mustard"},
-            {
-                "col": "Financial Services Receivables (Non-Current)",
-                "name": "Financial Services Receivables (Non-Current)",
-                "color_key": "cadet_blue",
-            },
-            {"col": "Investments", "name": "Investments", "color_key": "gold"},
-            {"col": "PPE", "name": "PPE", "color_key": "navy"},
-            {"col": "Right-of-Use Assets", "name": "Right-of-Use Assets", "color_key": "teal"},
-            {"col": "Intangibles", "name": "Intangibles", "color_key": "lavender"},
-            {"col": "Goodwill", "name": "Goodwill", "color_key": "pale_pink"},
-            {"col": "Other Financial Assets", "name": "Other Financial Assets", "color_key": "cream"},
-            {
-                "col": "Other Financial Assets (Non-Current)",
-                "name": "Other Financial Assets (Non-Current)",
-                "color_key": "cream",
-            },
-            {"col": "Deferred Tax Assets", "name": "Deferred Tax Assets", "color_key": "spring_green"},
-            {"col": "Other Non-Current Assets", "name": "Other Non-Current Assets", "color_key": "gray_light"},
-            {"col": "Other Assets", "name": "Other Assets", "color_key": "gray_light"},
+            _stack_entry(name, color_key)
+            for name, color_key in (
+                ("Cash & Equivalents", "mint"),
+                ("Accounts Receivable", "sky_blue"),
+                ("Financial Services Receivables (Current)", "cadet_blue"),
+                ("Inventories", "mustard"),
+                ("Other Financial Assets (Current)", "cream"),
+                ("Other Current Assets", "ice_blue"),
+                ("Assets Held for Sale", "mustard"),
+                ("Financial Services Receivables (Non-Current)", "cadet_blue"),
+                ("Investments", "gold"),
+                ("PPE", "navy"),
+                ("Right-of-Use Assets", "teal"),
+                ("Intangibles", "lavender"),
+                ("Goodwill", "pale_pink"),
+                ("Other Financial Assets", "cream"),
+                ("Other Financial Assets (Non-Current)", "cream"),
+                ("Deferred Tax Assets", "spring_green"),
+                ("Other Non-Current Assets", "gray_light"),
+                ("Other Assets", "gray_light"),
+            )
         ],
         "left_stack_for_bank": [
-            {"col": "Loans", "name": "Loans", "color_key": "cadet_blue"},
-            {"col": "Securities", "name": "Securities", "color_key": "gold"},
-            {"col": "Monetary Claims Bought", "name": "Monetary Claims Bought", "color_key": "lavender"},
-            {
-                "col": "Investments", "name": "Investments", "color_key": "gold"
-            },
-            {"col": "Trading Assets", "name": "Trading Assets", "color_key": "mustard"},
-            {
-                "col": "Receivables Under Resale Agreements",
-                "name": "Receivables Under Resale Agreements",
-                "color_key": "cadet_blue",
-            },
-            {
-                "col": "Receivables Under Securities Borrowing Transactions",
-                "name": "Receivables Under Securities Borrowing Transactions",
-                "color_key": "sky_blue",
-            },
-            {
-                "col": "Customers Liabilities for Acceptances & Guarantees",
-                "name": "Customers Liabilities for Acceptances & Guarantees",
-                "color_key": "spring_green",
-            },
-            {"col": "Cash & Equivalents", "name": "Cash & Equivalents", "color_key": "mint"},
-            {"col": "PPE", "name": "PPE", "color_key": "navy"},
-            {"col": "Intangibles", "name": "Intangibles", "color_key": "lavender"},
-            {"col": "Goodwill", "name": "Goodwill", "color_key": "pale_pink"},
-            {"col": "Deferred Tax Assets", "name": "Deferred Tax Assets", "color_key": "spring_green"},
-            {"col": "Other Financial Assets", "name": "Other Financial Assets", "color_key": "cream"},
-            {"col": "Other Assets", "name": "Other Assets", "color_key": "gray_light"},
+            _stack_entry(name, color_key)
+            for name, color_key in (
+                ("Loans", "cadet_blue"),
+                ("Securities", "gold"),
+                ("Monetary Claims Bought", "lavender"),
+                ("Investments", "gold"),
+                ("Trading Assets", "mustard"),
+                ("Receivables Under Resale Agreements", "cadet_blue"),
+                ("Receivables Under Securities Borrowing Transactions", "sky_blue"),
+                ("Customers Liabilities for Acceptances & Guarantees", "spring_green"),
+                ("Cash & Equivalents", "mint"),
+                ("PPE", "navy"),
+                ("Intangibles", "lavender"),
+                ("Goodwill", "pale_pink"),
+                ("Deferred Tax Assets", "spring_green"),
+                ("Other Financial Assets", "cream"),
+                ("Other Assets", "gray_light"),
+            )
         ],
         "left_stack_summary": [
-            {"col": "Current Assets", "name": "Current Assets", "color_key": "mint"},
-            {"col": "Non-Current Assets", "name": "Non-Current Assets", "color_key": "ice_blue"},
+            _stack_entry(name, color_key)
+            for name, color_key in (
+                ("Current Assets", "mint"),
+                ("Non-Current Assets", "ice_blue"),
+            )
         ],
         "right_stack": [
-            {"col": "Accounts Payable", "name": "Accounts Payable", "color_key": "gray_medium"},
-            {"col": "Short-Term Borrowings", "name": "Short-Term Borrowings", "color_key": "dark_slate"},
-            {"col": "Provisions (Current)", "name": "Provisions (Current)", "color_key": "cream"},
-            {"col": "Accrued Expenses", "name": "Accrued Expenses", "color_key": "gray_medium"},
-            {"col": "Income Taxes Payable", "name": "Income Taxes Payable", "color_key": "gray_medium"},
-            {
-                "col": "Retirement Benefit Liabilities (Current)",
-                "name": "Retirement Benefit Liabilities (Current)",
-                "color_key": "gray_medium",
-            },
-            {
-                "col": "Other Financial Liabilities (Current)",
-                "name": "Other Financial Liabilities (Current)",
-                "color_key": "cadet_blue",
-            },
-            {"col": "Other Current Liabilities", "name": "Other Current Liabilities", "color_key": "gray_light"},
-            {"col": "Liabilities Held for Sale", "name": "Liabilities Held for Sale", "color_key": "gray_light"},
-            {"col": "Long-Term Borrowings", "name": "Long-Term Borrowings", "color_key": "dark_slate"},
-            {"col": "Bonds Payable", "name": "Bonds Payable", "color_key": "coral"},
-            {"col": "Lease Liabilities", "name": "Lease Liabilities", "color_key": "gray_light"},
-            {"col": "Provisions", "name": "Provisions", "color_key": "cream"},
-            {"col": "Provisions (Non-Current)", "name": "Provisions (Non-Current)", "color_key": "cream"},
-            {
-                "col": "Retirement Benefit Liabilities",
-                "name": "Retirement Benefit Liabilities",
-                "color_key": "gray_medium",
-            },
-            {
-                "col": "Retirement Benefit Liabilities (Non-Current)",
-                "name": "Retirement Benefit Liabilities (Non-Current)",
-                "color_key": "gray_medium",
-            },
-            {"col": "Deferred Tax Liabilities", "name": "Deferred Tax Liabilities", "color_key": "teal"},
-            {"col": "Other Financial Liabilities", "name": "Other Financial Liabilities", "color_key": "cadet_blue"},
-            {
-                "col": "Other Financial Liabilities (Non-Current)",
-                "name": "Other Financial Liabilities (Non-Current)",
-                "color_key": "cadet_blue",
-            },
-            {"col": "Other Non-Current Liabilities", "name": "Other Non-Current Liabilities", "color_key": "gray_light"},
-            {"col": "Other Liabilities", "name": "Other Liabilities", "color_key": "gray_light"},
-            {"col": "Share Capital", "name": "Share Capital", "color_key": "midnight_blue"},
-            {"col": "Capital Surplus", "name": "Capital Surplus", "color_key": "cadet_blue"},
-            {"col": "Retained Earnings", "name": "Retained Earnings", "color_key": "spring_green"},
-            {"col": "Other Components of Equity", "name": "Other Components of Equity", "color_key": "gold"},
-            {"col": "Treasury Shares", "name": "Treasury Shares", "color_key": "gray_dark"},
-            {"col": "AOCI", "name": "AOCI", "color_key": "gold"},
-            {"col": "Non-Controlling Interests", "name": "Non-Controlling Interests", "color_key": "gray_light"},
+            _stack_entry(name, color_key)
+            for name, color_key in (
+                ("Accounts Payable", "gray_medium"),
+                ("Short-Term Borrowings", "dark_slate"),
+                ("Provisions (Current)", "cream"),
+                ("Accrued Expenses", "gray_medium"),
+                ("Income Taxes Payable", "gray_medium"),
+                ("Retirement Benefit Liabilities (Current)", "gray_medium"),
+                ("Other Financial Liabilities (Current)", "cadet_blue"),
+                ("Other Current Liabilities", "gray_light"),
+                ("Liabilities Held for Sale", "gray_light"),
+                ("Long-Term Borrowings", "dark_slate"),
+                ("Bonds Payable", "coral"),
+                ("Lease Liabilities", "gray_light"),
+                ("Provisions", "cream"),
+                ("Provisions (Non-Current)", "cream"),
+                ("Retirement Benefit Liabilities", "gray_medium"),
+                ("Retirement Benefit Liabilities (Non-Current)", "gray_medium"),
+                ("Deferred Tax Liabilities", "teal"),
+                ("Other Financial Liabilities", "cadet_blue"),
+                ("Other Financial Liabilities (Non-Current)", "cadet_blue"),
+                ("Other Non-Current Liabilities", "gray_light"),
+                ("Other Liabilities", "gray_light"),
+                ("Share Capital", "midnight_blue"),
+                ("Capital Surplus", "cadet_blue"),
+                ("Retained Earnings", "spring_green"),
+                ("Other Components of Equity", "gold"),
+                ("Treasury Shares", "gray_dark"),
+                ("AOCI", "gold"),
+                ("Non-Controlling Interests", "gray_light"),
+            )
         ],
         "right_stack_for_bank": [
-            {"col": "Deposits", "name": "Deposits", "color_key": "salmon"},
-            {"col": "Repo Liabilities", "name": "Repo Liabilities", "color_key": "coral"},
-            {"col": "Borrowings", "name": "Borrowings", "color_key": "dark_slate"},
-            {"col": "Negotiable CDs", "name": "Negotiable CDs", "color_key": "gold"},
-            {"col": "Call Money & Bills Sold", "name": "Call Money & Bills Sold", "color_key": "coral"},
-            {"col": "Trust Account Borrowings", "name": "Trust Account Borrowings", "color_key": "dark_slate"},
-            {"col": "Commercial Papers", "name": "Commercial Papers", "color_key": "mustard"},
-            {"col": "Trading Liabilities", "name": "Trading Liabilities", "color_key": "coral"},
-            {"col": "Acceptances & Guarantees", "name": "Acceptances & Guarantees", "color_key": "cream"},
-            {"col": "FX Liabilities", "name": "FX Liabilities", "color_key": "cadet_blue"},
-            {"col": "Securities Lending Payables", "name": "Securities Lending Payables", "color_key": "gray_medium"},
-            {"col": "Deferred Tax Liabilities", "name": "Deferred Tax Liabilities", "color_key": "teal"},
-            {"col": "Bonds Payable", "name": "Bonds Payable", "color_key": "coral"},
-            {"col": "Other Liabilities", "name": "Other Liabilities", "color_key": "gray_light"},
-            {"col": "Total Equity", "name": "Total Equity", "color_key": "sky_blue"},
+            _stack_entry(name, color_key)
+            for name, color_key in (
+                ("Deposits", "salmon"),
+                ("Repo Liabilities", "coral"),
+                ("Borrowings", "dark_slate"),
+                ("Negotiable CDs", "gold"),
+                ("Call Money & Bills Sold", "coral"),
+                ("Trust Account Borrowings", "dark_slate"),
+                ("Commercial Papers", "mustard"),
+                ("Trading Liabilities", "coral"),
+                ("Acceptances & Guarantees", "cream"),
+                ("FX Liabilities", "cadet_blue"),
+                ("Securities Lending Payables", "gray_medium"),
+                ("Deferred Tax Liabilities", "teal"),
+                ("Bonds Payable", "coral"),
+                ("Other Liabilities", "gray_light"),
+                ("Total Equity", "sky_blue"),
+            )
         ],
         "right_stack_summary": [
-            {"col": "Current Liabilities", "name": "Current Liabilities", "color_key": "gray_medium"},
-            {"col": "Non-Current Liabilities", "name": "Non-Current Liabilities", "color_key": "gray_light"},
-            {"col": "Total Equity", "name": "Total Equity", "color_key": "sky_blue"},
+            _stack_entry(name, color_key)
+            for name, color_key in (
+                ("Current Liabilities", "gray_medium"),
+                ("Non-Current Liabilities", "gray_light"),
+                ("Total Equity", "sky_blue"),
+            )
         ],
     },
     "portfolio_chart": {
@@ -859,7 +876,7 @@ _DEFAULT_LAYOUT: Dict[str, Any] = {
 }
 
 
-_COMPANY_LAYOUT_OVERRIDES: Dict[str, Dict[str, Any]] = {
+_COMPANY_LAYOUT_OVERRIDES: Mapping[str, Mapping[str, Any]] = {
     "toyota": {
         "bs_chart": {
             "left_stack_preference": "primary",
@@ -894,21 +911,72 @@ _COMPANY_LAYOUT_OVERRIDES: Dict[str, Dict[str, Any]] = {
 }
 
 
+def _intern_strings(value: Any) -> Any:
+    """Intern every string leaf of a layout structure in place."""
+    if isinstance(value, dict):
+        for key, item in value.items():
+            value[key] = _intern_strings(item)
+    elif isinstance(value, list):
+        value[:] = [_intern_strings(item) for item in value]
+    elif isinstance(value, str):
+        return sys.intern(value)
+    return value
+
+
+def _freeze(value: Any) -> Any:
+    """Return a read-only view of a layout structure (dicts as proxies, lists as tuples)."""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+_DEFAULT_LAYOUT = _freeze(_intern_strings(_DEFAULT_LAYOUT))
+_COMPANY_LAYOUT_OVERRIDES = _freeze(_intern_strings(_COMPANY_LAYOUT_OVERRIDES))
+
+
+@cache
+def _mapping_config(builder: Callable[[], Dict[str, Any]]) -> MappingConfig:
+    """Wrap a mapping bank in a MappingConfig once per accessor."""
+    return MappingConfig.from_dict(builder())
+
+
+def _clone_layout(value: Any) -> Any:
+    """Copy a layout into fresh dicts and lists, sharing immutable leaves."""
+    value_type = type(value)
+    if value_type is dict or value_type is MappingProxyType:
+        return {key: _clone_layout(item) for key, item in value.items()}
+    if value_type is list or value_type is tuple:
+        return [_clone_layout(item) for item in value]
+    return value
+
+
+def _json_loads(data: bytes) -> Any:
+    """Parse UTF-8 JSON, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    import json
+
+    return json.loads(data)
+
+
 class ColumnDefinitionConfig:
     """Resolve canonical mapping definitions by standard and company overrides."""
 
-    _STANDARD_OVERRIDES: Dict[str, Dict[str, Any]] = {
-        "IFRS": _IFRS_OVERRIDES,
-        "JGAAP": _JGAAP_OVERRIDES,
-        "USGAAP": _USGAAP_OVERRIDES,
+    _STANDARD_OVERRIDES: Dict[str, Callable[[], Dict[str, Any]]] = {
+        "IFRS": ifrs_overrides,
+        "JGAAP": jgaap_overrides,
+        "USGAAP": usgaap_overrides,
     }
-    _COMPANY_OVERRIDES: Dict[str, Dict[str, Dict[str, Any]]] = {
-        "mufg": {"JGAAP": _MUFG_OVERRIDES},
-        "toyota": {"IFRS": _TOYOTA_OVERRIDES},
-        "honda": {"IFRS": _HONDA_OVERRIDES},
+    _COMPANY_OVERRIDES: Dict[str, Dict[str, Callable[[], Dict[str, Any]]]] = {
+        "mufg": {"JGAAP": mufg_overrides},
+        "toyota": {"IFRS": toyota_overrides},
+        "honda": {"IFRS": honda_overrides},
     }
 
     @staticmethod
+    @lru_cache(maxsize=256)
     def _normalize_standard(standard: Optional[str]) -> Optional[str]:
         """Normalize standard labels to expected keys."""
         if not standard:
@@ -916,32 +984,46 @@ class ColumnDefinitionConfig:
         normalized = str(standard).strip().upper()
         if normalized in {"JPGAAP", "JAPAN GAAP"}:
             return "JGAAP"
-        return normalized
+        return sys.intern(normalized)
 
     @staticmethod
+    @lru_cache(maxsize=256)
     def _normalize_company(company_name: Optional[str]) -> Optional[str]:
         """Normalize company identifiers for lookup keys."""
         if not company_name:
             return None
-        return str(company_name).strip().lower()
+        return sys.intern(str(company_name).strip().lower())
 
     @classmethod
     def get_base_mapping(cls, standard: Optional[str]) -> Dict[str, Any]:
         """Return a base mapping for the given accounting standard."""
-        _ = cls._normalize_standard(standard)
         return MappingConfig.default_mapping()
 
     @classmethod
     def get_standard_override(cls, standard: Optional[str]) -> Optional[Dict[str, Any]]:
         """Return standard-specific overrides when defined."""
+        builder = cls._standard_builder(standard)
+        return builder() if builder else None
+
+    @classmethod
+    def get_company_override(cls, company_name: Optional[str], standard: Optional[str]) -> Optional[Dict[str, Any]]:
+        """Return company-specific overrides for the given standard."""
+        builder = cls._company_builder(company_name, standard)
+        return builder() if builder else None
+
+    @classmethod
+    def _standard_builder(cls, standard: Optional[str]) -> Optional[Callable[[], Dict[str, Any]]]:
+        """Return the override accessor for a standard, if any."""
         key = cls._normalize_standard(standard)
         if not key:
             return None
         return cls._STANDARD_OVERRIDES.get(key)
 
     @classmethod
-    def get_company_override(cls, company_name: Optional[str], standard: Optional[str]) -> Optional[Dict[str, Any]]:
-        """Return company-specific overrides for the given standard."""
+    def _company_builder(
+        cls, company_name: Optional[str], standard: Optional[str]
+    ) -> Optional[Callable[[], Dict[str, Any]]]:
+        """Return the override accessor for a company and standard, if any."""
         company_key = cls._normalize_company(company_name)
         if not company_key:
             return None
@@ -952,24 +1034,30 @@ class ColumnDefinitionConfig:
     @classmethod
     def resolve_mapping(cls, standard: Optional[str] = None, company_name: Optional[str] = None) -> Dict[str, Any]:
         """Resolve the effective mapping by layering standard and company overrides."""
-        base = cls.get_base_mapping(standard)
-        merged = cls.merge(base, cls.get_standard_override(standard))
-        return cls.merge(merged, cls.get_company_override(company_name, standard))
+        resolved = cls._resolve_mapping_cached(cls._normalize_standard(standard), cls._normalize_company(company_name))
+        return _clone_layout(resolved)
+
+    @classmethod
+    @lru_cache(maxsize=64)
+    def _resolve_mapping_cached(cls, std_key: Optional[str], company_key: Optional[str]) -> Dict[str, Any]:
+        """Merge the mapping banks once per normalized (standard, company) pair."""
+        overlay: Optional[MappingConfig] = None
+        for builder in (cls._standard_builder(std_key), cls._company_builder(company_key, std_key)):
+            if builder:
+                # Compose the small overrides first so the large default mapping is merged once.
+                overlay = overlay.merge_over(_mapping_config(builder)) if overlay else _mapping_config(builder)
+        return _mapping_config(MappingConfig.default_mapping).merge_over(overlay).to_dict()
 
     @classmethod
     def resolve_layout(cls, standard: Optional[str] = None, company_name: Optional[str] = None) -> Dict[str, Any]:
         """Resolve layout definitions for charts and snapshots."""
-        _ = cls._normalize_standard(standard)
-        base = json.loads(json.dumps(_DEFAULT_LAYOUT))
-        company_key = cls._normalize_company(company_name)
-        overlay = _COMPANY_LAYOUT_OVERRIDES.get(company_key, {}) if company_key else {}
-        return cls._merge_layout(base, overlay)
+        resolved = _RESOLVED_LAYOUTS.get(cls._normalize_company(company_name), _DEFAULT_LAYOUT)
+        return _clone_layout(resolved)
 
     @staticmethod
     def load_json(path: Path) -> Dict[str, Any]:
         """Load a JSON mapping file."""
-        with path.open("r", encoding="utf-8") as f:
-            return json.load(f)
+        return _json_loads(path.read_bytes())
 
     @staticmethod
     def merge(base: Dict[str, Any], overlay: Optional[Dict[str, Any]]) -> Dict[str, Any]:
@@ -977,14 +1065,25 @@ class ColumnDefinitionConfig:
         return MappingConfig.merge(base, overlay)
 
     @staticmethod
-    def _merge_layout(base: Dict[str, Any], overlay: Dict[str, Any]) -> Dict[str, Any]:
-        """Merge layout dictionaries with overlay keys replacing lists."""
-        if not overlay:
-            return base
-        merged = dict(base)
-        for key, value in overlay.items():
-            if isinstance(value, dict) and isinstance(base.get(key), dict):
-                merged[key] = ColumnDefinitionConfig._merge_layout(base.get(key, {}), value)
-            else:
-                merged[key] = value
-        return merged
+    def _merge_layout_inplace(base: Dict[str, Any], overlay: Dict[str, Any]) -> Dict[str, Any]:
+        """Merge an overlay into ``base`` in place, with overlay keys replacing lists."""
+        stack = [(base, overlay)]
+        while stack:
+            target, source = stack.pop()
+            for key, value in source.items():
+                current = target.get(key)
+                if isinstance(value, dict) and isinstance(current, dict):
+                    stack.append((current, value))
+                else:
+                    target[key] = value
+        return base
+
+
+_RESOLVED_LAYOUTS: Mapping[str, Mapping[str, Any]] = MappingProxyType(
+    {
+        company_key: _freeze(
+            ColumnDefinitionConfig._merge_layout_inplace(_clone_layout(_DEFAULT_LAYOUT), _clone_layout(overlay))
+        )
+        for company_key, overlay in _COMPANY_LAYOUT_OVERRIDES.items()
+    }
+)
@@ -1,16 +1,26 @@
 ﻿from __future__ import annotations
 
+import importlib.util
 import json
 import logging
 import re
 from dataclasses import dataclass
+from dataclasses import field as dataclass_field
 from enum import Enum
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+from typing import Any, ClassVar, Dict, Iterable, List, Optional, Pattern, Sequence, Tuple
 
+import numpy as np
 import pandas as pd
 
 from columuns_definition_config import ColumnDefinitionConfig
+from financial_mapping import MappingConfig, compile_pattern, compile_union
+
+try:
+    import orjson
+except ImportError:  # optional; the stdlib json module produces the same objects
+    orjson = None
 
 
 class StatementType(str, Enum):
@@ -31,7 +41,7 @@ class CanonicalPeriodFilter:
     min_duration_days: int = 300
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MappingCandidate:
     """A candidate matcher to map facts to a canonical key."""
 
@@ -39,9 +49,15 @@ class MappingCandidate:
     exact: Optional[str] = None
     regex: Optional[str] = None
     weight: float = 1.0
+    exact_lower: Optional[str] = dataclass_field(default=None, init=False, repr=False, compare=False)
+    pattern: Optional[Pattern[str]] = dataclass_field(default=None, init=False, repr=False, compare=False)
 
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "exact_lower", str(self.exact).lower() if self.exact else None)
+        object.__setattr__(self, "pattern", compile_pattern(self.regex) if self.regex else None)
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class CanonicalRule:
     """Mapping rule for a canonical line item."""
 
@@ -51,7 +67,7 @@ class CanonicalRule:
     candidates: Tuple[MappingCandidate, ...] = tuple()
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PortfolioRule:
     """Mapping rule for portfolio position extraction."""
 
@@ -60,6 +76,137 @@ class PortfolioRule:
     candidates: Tuple[MappingCandidate, ...] = tuple()
     aggregate_mode: Optional[str] = None
     exclude_regex: Tuple[str, ...] = tuple()
+    exclude_patterns: Tuple[Pattern[str], ...] = dataclass_field(default=(), init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        union = compile_union(self.exclude_regex) if self.exclude_regex else None
+        patterns = (union,) if union is not None else tuple(compile_pattern(regex) for regex in self.exclude_regex)
+        object.__setattr__(self, "exclude_patterns", patterns)
+
+
+# pandas' multithreaded CSV reader is used when pyarrow is installed; it is not a hard dependency.
+_HAS_PYARROW = importlib.util.find_spec("pyarrow") is not None
+# Period columns stay text under either engine; pyarrow would otherwise parse them as dates.
+_CSV_DTYPES = {"period_start": "str", "period_end": "str"}
+
+
+def _read_fact_csv(path: Path) -> pd.DataFrame:
+    """Read one fact CSV, preferring the pyarrow engine when it is available."""
+    if not _HAS_PYARROW:
+        return pd.read_csv(path, dtype=_CSV_DTYPES)
+    df = pd.read_csv(path, engine="pyarrow", dtype=_CSV_DTYPES)
+    # pyarrow leaves None in mixed/bool columns where the C engine yields NaN.
+    object_cols = df.columns[df.dtypes == object]
+    if len(object_cols):
+        df[object_cols] = df[object_cols].fillna(np.nan)
+    return df
+
+
+def _iso_date_text(values: pd.Series) -> pd.Series:
+    """Keep stripped YYYY-MM-DD strings and blank out anything else."""
+    values = values.str.strip()
+    return values.where(pd.to_datetime(values, format="%Y-%m-%d", errors="coerce").notna())
+
+
+# Candidate regexes without metacharacters can be matched as plain substrings.
+_LITERAL_PATTERN_RE = re.compile(r"[A-Za-z0-9]+")
+
+# Canonical wide tables label periods as "<start>-<end>" with ISO dates.
+_PERIOD_DATE_RE = re.compile(r"(\d{4}-\d{2}-\d{2})-(\d{4}-\d{2}-\d{2})")
+
+_FIELD_COLUMNS = {
+    "element": "Element",
+    "tag": "Tag",
+    "label": "Label",
+}
+
+# Long-form output columns and the normalized fact columns they are read from.
+_LONG_COLUMNS = {
+    "period_end": "period_end",
+    "period_start": "period_start",
+    "period_type": "period_type",
+    "value": "value",
+    "currency": "currency",
+    "consolidated": "Consolidated",
+    "standard": "Standard",
+    "tag": "Tag",
+    "element": "Element",
+    "label": "Label",
+    "context_id": "ContextID",
+    "match_score": "match_score",
+}
+
+# Categorical text copies of the match columns, added by FinancialAnalyzer._normalize_facts.
+_TEXT_COLUMNS = {
+    "Element": "element_text",
+    "Tag": "tag_text",
+    "Label": "label_text",
+}
+
+
+@dataclass(frozen=True, slots=True)
+class _CandidateColumns:
+    """Candidates regrouped per fact column as parallel pattern/weight tuples."""
+
+    regex_columns: Dict[str, Tuple[Optional[Pattern[str]], Tuple[Pattern[str], ...], Tuple[Optional[str], ...], Tuple[float, ...]]]
+    exact_weights: Dict[str, Dict[str, float]]
+    combined: Tuple[Tuple[str, MappingCandidate], ...]
+    fields: Tuple[str, ...]
+
+
+@lru_cache(maxsize=4096)
+def _dimension_allowed(dim_value: str, allowed_suffixes: Tuple[str, ...]) -> bool:
+    """Check that every axis of a dimensions JSON string ends with an allowed suffix."""
+    if not dim_value or dim_value in {"{}", "nan", "None"}:
+        return False
+    # Only a JSON object with at least one quoted key can pass, so skip the parse for anything else.
+    if not dim_value.lstrip().startswith("{") or '"' not in dim_value:
+        return False
+    try:
+        parsed = orjson.loads(dim_value) if orjson is not None else json.loads(dim_value)
+    except Exception:
+        return False
+    if not isinstance(parsed, dict) or not parsed:
+        return False
+    return all(str(key).endswith(allowed_suffixes) for key in parsed)
+
+
+@lru_cache(maxsize=None)
+def _candidate_columns(candidates: Tuple[MappingCandidate, ...]) -> _CandidateColumns:
+    """Group candidates by fact column once per candidate tuple."""
+    patterns: Dict[str, List[str]] = {}
+    weights: Dict[str, List[float]] = {}
+    exact_weights: Dict[str, Dict[str, float]] = {}
+    combined: List[Tuple[str, MappingCandidate]] = []
+    for cand in candidates:
+        field_name = _FIELD_COLUMNS.get(cand.field)
+        if not field_name:
+            continue
+        if cand.exact and cand.regex:
+            combined.append((field_name, cand))
+        elif cand.regex:
+            patterns.setdefault(field_name, []).append(cand.regex)
+            weights.setdefault(field_name, []).append(cand.weight)
+        elif cand.exact:
+            # Exact candidates collapse into one lowercase lookup table per column.
+            table = exact_weights.setdefault(field_name, {})
+            table[cand.exact_lower] = table.get(cand.exact_lower, 0.0) + cand.weight
+    used_fields = {*patterns, *exact_weights, *(name for name, _ in combined)}
+    return _CandidateColumns(
+        regex_columns={
+            name: (
+                compile_union(tuple(values)),
+                tuple(compile_pattern(value) for value in values),
+                # Plain alphanumeric patterns are matched as lowercase substrings instead of via the regex engine.
+                tuple(value.lower() if _LITERAL_PATTERN_RE.fullmatch(value) else None for value in values),
+                tuple(weights[name]),
+            )
+            for name, values in patterns.items()
+        },
+        exact_weights=exact_weights,
+        combined=tuple(combined),
+        fields=tuple(name for name in _TEXT_COLUMNS if name in used_fields),
+    )
 
 
 class FinancialAnalyzer:
@@ -71,6 +218,71 @@ class FinancialAnalyzer:
         "ConsolidatedOrSeparateFinancialStatementsAxis",
     )
 
+    # Portfolio extraction rules with regex-based candidates.
+    _PORTFOLIO_RULES: ClassVar[Tuple[PortfolioRule, ...]] = (
+        PortfolioRule(
+            portfolio_key="EquitySecurities",
+            period_type="instant",
+            aggregate_mode="sum",
+            candidates=(
+                MappingCandidate(field="element", regex=r"BookValueDetailsOf.*EquitySecurities"),
+                MappingCandidate(field="label", regex=r"Book Value.*Equity Securities"),
+            ),
+            exclude_regex=(
+                r"NumberOfShares",
+                r"NameOfSecurities",
+                r"PurposesOfHolding",
+                r"WhetherIssuer",
+                r"ReasonForIncrease",
+                r"NumberOfNames",
+            ),
+        ),
+        PortfolioRule(
+            portfolio_key="DebtSecurities",
+            period_type="instant",
+            candidates=(
+                MappingCandidate(field="element", regex=r"DebtSecurities|BondSecurities|BondsSecurities"),
+                MappingCandidate(field="label", regex=r"Debt Securities|Bond Investments"),
+            ),
+        ),
+        PortfolioRule(
+            portfolio_key="TotalSecurities",
+            period_type="instant",
+            candidates=(
+                MappingCandidate(field="element", exact="InvestmentSecurities", weight=1.2),
+                MappingCandidate(field="element", exact="SecuritiesAssetsBNK", weight=1.2),
+                MappingCandidate(field="element", regex=r"^AvailableForSaleSecurities$"),
+                MappingCandidate(field="element", regex=r"^HeldToMaturitySecurities$"),
+                MappingCandidate(field="element", regex=r"^TradingSecurities$"),
+                MappingCandidate(field="label", regex=r"^Investment Securities$|^Securities$"),
+            ),
+            exclude_regex=(
+                r"ValuationDifference",
+                r"GainLoss",
+                r"Unrealized",
+                r"ChangesInFairValue",
+            ),
+        ),
+        PortfolioRule(
+            portfolio_key="DerivativeAssets",
+            period_type="instant",
+            candidates=(
+                MappingCandidate(field="element", regex=r"DerivativeAssets|DerivativesAssets"),
+                MappingCandidate(field="element", regex=r"DerivativeFinancialAssets|DerivativesFinancialAssets"),
+                MappingCandidate(field="label", regex=r"Derivative Assets"),
+            ),
+        ),
+        PortfolioRule(
+            portfolio_key="DerivativeLiabilities",
+            period_type="instant",
+            candidates=(
+                MappingCandidate(field="element", regex=r"DerivativeLiabilities|DerivativesLiabilities"),
+                MappingCandidate(field="element", regex=r"DerivativeFinancialLiabilities|DerivativesFinancialLiabilities"),
+                MappingCandidate(field="label", regex=r"Derivative Liabilities"),
+            ),
+        ),
+    )
+
     def __init__(
         self,
         facts: pd.DataFrame,
@@ -80,6 +292,7 @@ class FinancialAnalyzer:
         company_name: Optional[str] = None,
     ) -> None:
         self.facts = self._normalize_facts(facts)
+        self._undimensioned_facts = self.facts[self.facts["dimension_allowed"].to_numpy(dtype=bool)]
         self.prefer_consolidated = prefer_consolidated
         self.standard = standard or self._infer_standard(self.facts)
         self.company_name = company_name
@@ -101,7 +314,7 @@ class FinancialAnalyzer:
         company_name: Optional[str] = None,
     ) -> "FinancialAnalyzer":
         """Load multiple parsed CSVs and construct an analyzer."""
-        dfs = [pd.read_csv(path) for path in csv_paths]
+        dfs = [_read_fact_csv(path) for path in csv_paths]
         merged = pd.concat(dfs, ignore_index=True) if dfs else pd.DataFrame()
         return cls(
             merged,
@@ -131,30 +344,13 @@ class FinancialAnalyzer:
     ) -> pd.DataFrame:
         """Extract portfolio-related positions by category."""
         period_filter = period_filter or CanonicalPeriodFilter(prefer_duration=False, min_duration_days=0)
-        rows: List[Dict[str, Any]] = []
-        for rule in self._portfolio_rules():
+        pieces: List[pd.DataFrame] = []
+        for rule in self._PORTFOLIO_RULES:
             matched = self._match_portfolio_rule(rule, period_filter, consolidated)
             if matched.empty:
                 continue
-            for _, row in matched.iterrows():
-                rows.append(
-                    {
-                        "portfolio_key": rule.portfolio_key,
-                        "period_end": row.get("period_end"),
-                        "period_start": row.get("period_start"),
-                        "period_type": row.get("period_type"),
-                        "value": row.get("value"),
-                        "currency": row.get("currency"),
-                        "consolidated": row.get("Consolidated"),
-                        "standard": row.get("Standard"),
-                        "tag": row.get("Tag"),
-                        "element": row.get("Element"),
-                        "label": row.get("Label"),
-                        "context_id": row.get("ContextID"),
-                        "match_score": row.get("match_score"),
-                    }
-                )
-        return pd.DataFrame(rows)
+            pieces.append(self._long_rows(matched, {"portfolio_key": rule.portfolio_key}))
+        return self._concat_long_rows(pieces)
 
     def get_portfolio_timeseries(
         self,
@@ -170,17 +366,8 @@ class FinancialAnalyzer:
                 columns += [spec.get("column_name", spec.get("portfolio_key", "")) for spec in series_defs]
             return pd.DataFrame(columns=columns)
 
-        long_df = long_df.copy()
-        long_df["period_label"] = long_df["period_end"].astype(str)
-        wide = (
-            long_df.pivot_table(
-                index="period_label",
-                columns="portfolio_key",
-                values="value",
-                aggfunc="first",
-            )
-            .reset_index()
-        )
+        long_df = long_df.assign(period_label=long_df["period_end"].astype(str))
+        wide = self._first_value_pivot(long_df, ["period_label"], "portfolio_key")
 
         if "TotalSecurities" in wide.columns:
             total_series = pd.to_numeric(wide["TotalSecurities"], errors="coerce")
@@ -340,28 +527,23 @@ class FinancialAnalyzer:
         long_df = long_df.copy()
         long_df["period_label"] = long_df["period_start"].astype(str) + "-" + long_df["period_end"].astype(str)
 
-        label_choice = (
-            long_df.groupby(["canonical_key", "label"])
-            .size()
-            .reset_index(name="count")
-            .sort_values(["canonical_key", "count"], ascending=[True, False])
-            .drop_duplicates(subset=["canonical_key"])
-            .set_index("canonical_key")["label"]
-        )
+        # Most frequent label per key; idxmax keeps the alphabetically first label on ties.
+        label_counts = long_df.groupby(["canonical_key", "label"]).size()
+        label_choice = label_counts.groupby(level="canonical_key").idxmax().str[1]
 
-        wide = (
-            long_df.pivot_table(
-                index=["canonical_key", "statement"],
-                columns="period_label",
-                values="value",
-                aggfunc="first",
-            )
-            .reset_index()
-        )
+        wide = self._first_value_pivot(long_df, ["canonical_key", "statement"], "period_label")
         wide["label"] = wide["canonical_key"].map(label_choice)
         wide = wide[["canonical_key", "label", "statement"] + [c for c in wide.columns if c not in {"canonical_key", "label", "statement"}]]
         return wide
 
+    @staticmethod
+    def _first_value_pivot(long_df: pd.DataFrame, index: List[str], columns: str) -> pd.DataFrame:
+        """Pivot the first non-null value per cell, like pivot_table(aggfunc="first")."""
+        keys = index + [columns]
+        # pivot_table skips missing values and missing keys before taking the first value per cell.
+        values = long_df.dropna(subset=["value", *keys]).drop_duplicates(subset=keys, keep="first")
+        return values.set_index(keys)["value"].unstack(columns).reset_index()
+
     def resolve_canonical_long(
         self,
         statement: StatementType,
@@ -372,33 +554,30 @@ class FinancialAnalyzer:
         period_filter = period_filter or CanonicalPeriodFilter()
         target_rules = [r for r in self.rules if r.statement == statement]
 
-        rows: List[Dict[str, Any]] = []
+        pieces: List[pd.DataFrame] = []
         for rule in target_rules:
             matched = self._match_rule(rule, period_filter, consolidated)
             if matched.empty:
                 continue
+            pieces.append(
+                self._long_rows(matched, {"canonical_key": rule.canonical_key, "statement": rule.statement.value})
+            )
+        return self._concat_long_rows(pieces)
 
-            for _, row in matched.iterrows():
-                rows.append(
-                    {
-                        "canonical_key": rule.canonical_key,
-                        "statement": rule.statement.value,
-                        "period_end": row.get("period_end"),
-                        "period_start": row.get("period_start"),
-                        "period_type": row.get("period_type"),
-                        "value": row.get("value"),
-                        "currency": row.get("currency"),
-                        "consolidated": row.get("Consolidated"),
-                        "standard": row.get("Standard"),
-                        "tag": row.get("Tag"),
-                        "element": row.get("Element"),
-                        "label": row.get("Label"),
-                        "context_id": row.get("ContextID"),
-                        "match_score": row.get("match_score"),
-                    }
-                )
+    @staticmethod
+    def _long_rows(matched: pd.DataFrame, keys: Dict[str, Any]) -> pd.DataFrame:
+        """Project matched facts onto the long-form output columns, prefixed by rule keys."""
+        columns = dict(keys)
+        for name, source in _LONG_COLUMNS.items():
+            columns[name] = matched[source].to_numpy() if source in matched.columns else None
+        return pd.DataFrame(columns, index=pd.RangeIndex(len(matched)))
 
-        return pd.DataFrame(rows)
+    @staticmethod
+    def _concat_long_rows(pieces: List[pd.DataFrame]) -> pd.DataFrame:
+        """Stack per-rule long-form pieces, inferring dtypes across all rows."""
+        if not pieces:
+            return pd.DataFrame()
+        return pd.concat([piece.astype(object) for piece in pieces], ignore_index=True).infer_objects()
 
     def _match_rule(
         self,
@@ -420,16 +599,13 @@ class FinancialAnalyzer:
         if df.empty:
             return df
 
-        scores = self._score_candidates(df, rule.candidates)
+        scores = self._score_candidates(df, rule.candidates).to_numpy()
         if rule.canonical_key == "TotalEquity":
-            element_values = df.get("Element", "").astype(str)
-            label_values = df.get("Label", "").astype(str)
-            exclude_mask = element_values.str.contains("LiabilitiesAndNetAssets", regex=False) | label_values.str.contains(
-                "LiabilitiesAndNetAssets", regex=False
-            )
-            if exclude_mask.any():
-                scores = scores.copy()
-                scores.loc[exclude_mask] = 0.0
+            exclude_mask = np.zeros(len(df), dtype=bool)
+            for column in ("Element", "Label"):
+                if column in df.columns:
+                    exclude_mask |= df[column].astype(str).str.contains("LiabilitiesAndNetAssets", regex=False).to_numpy(dtype=bool)
+            scores = np.where(exclude_mask, 0.0, scores)
 
         df = df.copy()
         df["match_score"] = scores
@@ -443,16 +619,7 @@ class FinancialAnalyzer:
         if "Consolidated" in df.columns:
             df["is_preferred_consolidated"] = df["Consolidated"] == True
 
-        df = df.sort_values(
-            by=["period_end_dt", "is_preferred_consolidated", "match_score", "has_currency", "abs_numeric"],
-            ascending=[False, False, False, False, False],
-        )
-
-        best_rows = []
-        for _, group in df.groupby("period_end"):
-            best_rows.append(group.iloc[0])
-
-        return pd.DataFrame(best_rows)
+        return self._best_per_period(df)
 
     def _match_portfolio_rule(
         self,
@@ -465,16 +632,12 @@ class FinancialAnalyzer:
         if df.empty:
             return df
 
-        if rule.exclude_regex:
-            combined = (
-                df.get("Element", "").astype(str).fillna("")
-                + " "
-                + df.get("Label", "").astype(str).fillna("")
-                + " "
-                + df.get("Tag", "").astype(str).fillna("")
-            )
-            pattern = "|".join(rule.exclude_regex)
-            df = df[~combined.str.contains(pattern, case=False, regex=True, na=False)]
+        if rule.exclude_patterns:
+            excluded = np.zeros(len(df), dtype=bool)
+            for text_column in _TEXT_COLUMNS.values():
+                for pattern in rule.exclude_patterns:
+                    excluded |= df[text_column].str.contains(pattern, regex=True, na=False).to_numpy(dtype=bool)
+            df = df[~excluded]
             if df.empty:
                 return df
 
@@ -497,38 +660,44 @@ class FinancialAnalyzer:
         df["value"] = df["numeric_value"].where(df["numeric_value"].notna(), df["Value"])
         if rule.aggregate_mode == "sum":
             df["value"] = pd.to_numeric(df["value"], errors="coerce")
-            grouped_rows = []
-            for _, group in df.groupby("period_end"):
-                if "Consolidated" in group.columns and (group["Consolidated"] == True).any():
-                    group = group[group["Consolidated"] == True]
-                total = group["value"].sum(skipna=True)
-                if pd.isna(total) or total == 0:
-                    continue
-                group = group.copy()
-                group["value"] = total
-                group["numeric_value"] = total
-                group["is_preferred_consolidated"] = group["Consolidated"] == True if "Consolidated" in group.columns else False
-                group = group.sort_values(
-                    by=["period_end_dt", "is_preferred_consolidated", "match_score", "has_currency", "abs_numeric"],
-                    ascending=[False, False, False, False, False],
-                )
-                grouped_rows.append(group.iloc[0])
-            return pd.DataFrame(grouped_rows)
+            df = df[df["period_end"].notna().to_numpy()]
+            periods = df["period_end"].to_numpy()
+            df["is_preferred_consolidated"] = False
+            if "Consolidated" in df.columns:
+                # Within a period, consolidated facts replace the rest whenever any exist.
+                is_consolidated = (df["Consolidated"] == True).to_numpy()
+                has_consolidated = pd.Series(is_consolidated).groupby(periods).transform("any").to_numpy()
+                df = df[is_consolidated | ~has_consolidated]
+                periods = df["period_end"].to_numpy()
+                df["is_preferred_consolidated"] = df["Consolidated"] == True
+            totals = df["value"].groupby(periods).transform("sum").to_numpy()
+            keep = ~np.isnan(totals) & (totals != 0)
+            df = df[keep]
+            df["value"] = totals[keep]
+            df["numeric_value"] = totals[keep]
+            return self._best_per_period(df)
 
         df["is_preferred_consolidated"] = False
         if "Consolidated" in df.columns:
             df["is_preferred_consolidated"] = df["Consolidated"] == True
 
-        df = df.sort_values(
-            by=["period_end_dt", "is_preferred_consolidated", "match_score", "has_currency", "abs_numeric"],
-            ascending=[False, False, False, False, False],
-        )
+        return self._best_per_period(df)
 
-        best_rows = []
-        for _, group in df.groupby("period_end"):
-            best_rows.append(group.iloc[0])
-
-        return pd.DataFrame(best_rows)
+    @staticmethod
+    def _best_per_period(df: pd.DataFrame) -> pd.DataFrame:
+        """Keep the top-ranked fact for each period_end, ordered by period_end."""
+        # fact_rank already orders currency and magnitude ties, so only the rule-specific keys are sorted here.
+        order = np.lexsort(
+            (
+                df["fact_rank"].to_numpy(),
+                -df["match_score"].to_numpy(dtype="float64"),
+                -df["is_preferred_consolidated"].to_numpy(dtype=np.int8),
+                -df["period_end_days"].to_numpy(),
+            )
+        )
+        df = df.iloc[order]
+        best = df[df["period_end"].notna().to_numpy()].drop_duplicates(subset="period_end", keep="first")
+        return best.sort_values("period_end", kind="stable").infer_objects()
 
     def _filter_facts(
         self,
@@ -547,13 +716,9 @@ class FinancialAnalyzer:
         if cached is not None:
             return cached
 
-        df = self.facts
-
-        if not include_dimensioned and "dimension_allowed" in df.columns:
-            df = df[df["dimension_allowed"]]
-
+        df = self.facts if include_dimensioned else self._undimensioned_facts
         if period_type:
-            df = df[df["period_type"] == period_type]
+            df = df[(df["period_type"] == period_type).to_numpy()]
 
         if period_filter.prefer_duration:
             duration_mask = df["period_type"] == "duration"
@@ -570,20 +735,15 @@ class FinancialAnalyzer:
 
     def _candidate_match(self, row: pd.Series, cand: MappingCandidate) -> bool:
         """Check whether a candidate matches a fact row."""
-        field_map = {
-            "element": "Element",
-            "tag": "Tag",
-            "label": "Label",
-        }
-        field_name = field_map.get(cand.field)
+        field_name = _FIELD_COLUMNS.get(cand.field)
         if not field_name:
             return False
 
         value = str(row.get(field_name, "") or "")
-        if cand.exact and value.lower() == cand.exact.lower():
+        if cand.exact_lower and value.lower() == cand.exact_lower:
             return True
-        if cand.regex:
-            return re.search(cand.regex, value, flags=re.IGNORECASE) is not None
+        if cand.pattern:
+            return cand.pattern.search(value) is not None
         return False
 
     @staticmethod
@@ -592,102 +752,50 @@ class FinancialAnalyzer:
         if df.empty or not candidates:
             return pd.Series(0.0, index=df.index, dtype="float64")
 
-        field_map = {
-            "element": "Element",
-            "tag": "Tag",
-            "label": "Label",
-        }
-        field_cache: Dict[str, pd.Series] = {}
-        field_lower_cache: Dict[str, pd.Series] = {}
-        scores = pd.Series(0.0, index=df.index, dtype="float64")
-
-        for cand in candidates:
-            field_name = field_map.get(cand.field)
-            if not field_name or field_name not in df.columns:
-                continue
-            if field_name not in field_cache:
-                field_cache[field_name] = df[field_name].astype(str)
-
-            match = None
-            if cand.exact:
-                if field_name not in field_lower_cache:
-                    field_lower_cache[field_name] = field_cache[field_name].str.lower()
-                exact_value = str(cand.exact).lower()
-                match = field_lower_cache[field_name] == exact_value
-            if cand.regex:
-                regex_match = field_cache[field_name].str.contains(cand.regex, case=False, regex=True)
-                match = regex_match if match is None else (match | regex_match)
-            if match is None:
+        plan = _candidate_columns(tuple(candidates))
+        scores = np.zeros(len(df), dtype="float64")
+        for field_name in plan.fields:
+            if field_name not in df.columns:
                 continue
-            scores += cand.weight * match.astype(float)
+            # Match against the distinct values of the categorical text column, then gather the
+            # per-value weights back onto the rows. The extra trailing slot scores missing values.
+            text = df[_TEXT_COLUMNS[field_name]]
+            values = pd.Series(text.cat.categories, dtype=object)
+            value_scores = np.zeros(len(values) + 1, dtype="float64")
+
+            lower_values = values.str.lower()
+            if field_name in plan.regex_columns:
+                union, patterns, literals, weights = plan.regex_columns[field_name]
+                if union is None:
+                    # No safe union for these patterns (see compile_union); test every value.
+                    hit = np.ones(len(values), dtype=bool)
+                else:
+                    hit = values.str.contains(union, regex=True).to_numpy(dtype=bool)
+                if hit.any():
+                    hit_values = values[hit]
+                    hit_lower = lower_values[hit]
+                    hit_scores = np.zeros(len(hit_values), dtype="float64")
+                    for pattern, literal, weight in zip(patterns, literals, weights):
+                        if literal is not None:
+                            matched = hit_lower.str.contains(literal, regex=False)
+                        else:
+                            matched = hit_values.str.contains(pattern, regex=True)
+                        hit_scores += weight * matched.to_numpy(dtype=bool)
+                    value_scores[:-1][hit] += hit_scores
+
+            if field_name in plan.exact_weights:
+                value_scores[:-1] += lower_values.map(plan.exact_weights[field_name]).fillna(0.0).to_numpy(dtype="float64")
+
+            for combined_field, cand in plan.combined:
+                if combined_field != field_name:
+                    continue
+                match = (lower_values == cand.exact_lower).to_numpy(dtype=bool)
+                match |= values.str.contains(cand.pattern, regex=True).to_numpy(dtype=bool)
+                value_scores[:-1] += cand.weight * match
 
-        return scores
+            scores += value_scores[text.cat.codes.to_numpy()]
 
-    def _portfolio_rules(self) -> List[PortfolioRule]:
-        """Return portfolio extraction rules with regex-based candidates."""
-        return [
-            PortfolioRule(
-                portfolio_key="EquitySecurities",
-                period_type="instant",
-                aggregate_mode="sum",
-                candidates=(
-                    MappingCandidate(field="element", regex=r"BookValueDetailsOf.*EquitySecurities"),
-                    MappingCandidate(field="label", regex=r"Book Value.*Equity Securities"),
-                ),
-                exclude_regex=(
-                    r"NumberOfShares",
-                    r"NameOfSecurities",
-                    r"PurposesOfHolding",
-                    r"WhetherIssuer",
-                    r"ReasonForIncrease",
-                    r"NumberOfNames",
-                ),
-            ),
-            PortfolioRule(
-                portfolio_key="DebtSecurities",
-                period_type="instant",
-                candidates=(
-                    MappingCandidate(field="element", regex=r"DebtSecurities|BondSecurities|BondsSecurities"),
-                    MappingCandidate(field="label", regex=r"Debt Securities|Bond Investments"),
-                ),
-            ),
-            PortfolioRule(
-                portfolio_key="TotalSecurities",
-                period_type="instant",
-                candidates=(
-                    MappingCandidate(field="element", exact="InvestmentSecurities", weight=1.2),
-                    MappingCandidate(field="element", exact="SecuritiesAssetsBNK", weight=1.2),
-                    MappingCandidate(field="element", regex=r"^AvailableForSaleSecurities$"),
-                    MappingCandidate(field="element", regex=r"^HeldToMaturitySecurities$"),
-                    MappingCandidate(field="element", regex=r"^TradingSecurities$"),
-                    MappingCandidate(field="label", regex=r"^Investment Securities$|^Securities$"),
-                ),
-                exclude_regex=(
-                    r"ValuationDifference",
-                    r"GainLoss",
-                    r"Unrealized",
-                    r"ChangesInFairValue",
-                ),
-            ),
-            PortfolioRule(
-                portfolio_key="DerivativeAssets",
-                period_type="instant",
-                candidates=(
-                    MappingCandidate(field="element", regex=r"DerivativeAssets|DerivativesAssets"),
-                    MappingCandidate(field="element", regex=r"DerivativeFinancialAssets|DerivativesFinancialAssets"),
-                    MappingCandidate(field="label", regex=r"Derivative Assets"),
-                ),
-            ),
-            PortfolioRule(
-                portfolio_key="DerivativeLiabilities",
-                period_type="instant",
-                candidates=(
-                    MappingCandidate(field="element", regex=r"DerivativeLiabilities|DerivativesLiabilities"),
-                    MappingCandidate(field="element", regex=r"DerivativeFinancialLiabilities|DerivativesFinancialLiabilities"),
-                    MappingCandidate(field="label", regex=r"Derivative Liabilities"),
-                ),
-            ),
-        ]
+        return pd.Series(scores, index=df.index)
 
     def _rules_from_mapping(self, mapping: Dict[str, Any]) -> List[CanonicalRule]:
         """Convert a mapping dict into CanonicalRule list."""
@@ -755,12 +863,14 @@ class FinancialAnalyzer:
         df["numeric_value"] = df["numeric_value"].fillna(value_num)
 
         if "Period/Setting" in df.columns:
-            period_setting = df["Period/Setting"].astype(str)
-            duration = period_setting.str.extract(r"(?P<start>\\d{4}-\\d{2}-\\d{2})\\s*-\\s*(?P<end>\\d{4}-\\d{2}-\\d{2})")
-            instant = period_setting.str.extract(r"Instant:\\s*(?P<instant>\\d{4}-\\d{2}-\\d{2})")
-            df["period_start"] = df["period_start"].fillna(duration["start"])
-            df["period_end"] = df["period_end"].fillna(duration["end"])
-            df["period_end"] = df["period_end"].fillna(instant["instant"])
+            # The parser writes either "Instant: YYYY-MM-DD" or "YYYY-MM-DD - YYYY-MM-DD".
+            period_setting = df["Period/Setting"].astype(str).str.strip()
+            is_instant = period_setting.str.startswith("Instant:").fillna(False).astype(bool)
+            bounds = period_setting.where(~is_instant).str.split(" - ", n=1, expand=True, regex=False)
+            bounds = bounds.reindex(columns=[0, 1])
+            instant = _iso_date_text(period_setting.where(is_instant).str.slice(8))
+            df["period_start"] = df["period_start"].fillna(_iso_date_text(bounds[0]))
+            df["period_end"] = df["period_end"].fillna(_iso_date_text(bounds[1]).fillna(instant))
 
         df["period_start_dt"] = pd.to_datetime(df["period_start"], errors="coerce")
         df["period_end_dt"] = pd.to_datetime(df["period_end"], errors="coerce")
@@ -771,55 +881,64 @@ class FinancialAnalyzer:
         df["period_end"] = df["period_end_dt"].dt.date.astype(str)
 
         df["duration_days"] = (df["period_end_dt"] - df["period_start_dt"]).dt.days
+        # Compact ranking key; rows without a period end are dropped below.
+        df["period_end_days"] = (df["period_end_dt"] - pd.Timestamp(0)).dt.days.fillna(0).astype("int32")
 
         df["has_currency"] = df["currency"].notna() & (df["currency"].astype(str).str.len() > 0)
         df["abs_numeric"] = df["numeric_value"].abs()
+        for column, text_column in _TEXT_COLUMNS.items():
+            df[text_column] = df[column].astype(str).astype("category")
 
         if "dimensions" in df.columns:
             dim_series = df["dimensions"].astype(str).str.strip()
-            dim_mask = dim_series.isna() | dim_series.eq("") | dim_series.eq("{}") | dim_series.eq("nan") | dim_series.eq("None")
-            allowed_map = {value: self._is_allowed_dimension(value) for value in dim_series.unique()}
-            allowed_mask = dim_series.map(allowed_map)
+            dim_mask = dim_series.isna() | dim_series.isin(("", "{}", "nan", "None"))
+            # Dimension payloads repeat heavily, so each distinct JSON string is parsed once.
+            allowed_map = {value: self._is_allowed_dimension(value) for value in dim_series[~dim_mask].unique()}
+            allowed_mask = dim_series.map(allowed_map).eq(True)
             df["dimension_allowed"] = dim_mask | allowed_mask
         else:
             df["dimension_allowed"] = True
 
-        df = df[df["is_text_block"] != True].copy()
-        text_block_mask = (
-            df["Element"].astype(str).str.endswith("TextBlock")
-            | df["Tag"].astype(str).str.endswith("TextBlock")
-            | df["Label"].astype(str).str.endswith("TextBlock")
+        # Text blocks and facts without a period end are dropped with one combined mask.
+        keep = (df["is_text_block"] != True).to_numpy(dtype=bool) & df["period_end_dt"].notna().to_numpy()
+        # The categorical text columns test each distinct string once instead of every row.
+        for text_column in _TEXT_COLUMNS.values():
+            keep &= ~df[text_column].str.endswith("TextBlock", na=False).to_numpy(dtype=bool)
+        df = df[keep]
+
+        # Rank on the rule-independent keys once (newest period, currency-tagged, largest magnitude, row order)
+        # so per-rule selection only has to sort on match score and consolidation preference.
+        abs_numeric = df["abs_numeric"].to_numpy(dtype="float64")
+        order = np.lexsort(
+            (
+                np.where(np.isnan(abs_numeric), np.inf, -abs_numeric),
+                -df["has_currency"].to_numpy(dtype=np.int8),
+                -df["period_end_days"].to_numpy(),
+            )
         )
-        df = df.loc[~text_block_mask]
-        df = df[df["period_end_dt"].notna()]
-
-        return df
+        fact_rank = np.empty(len(order), dtype=np.int64)
+        fact_rank[order] = np.arange(len(order))
+        return df.assign(fact_rank=fact_rank)
 
     def _is_allowed_dimension(self, dim_value: str) -> bool:
         """Allow consolidation-only dimensions while rejecting segment-level splits."""
-        if not dim_value or dim_value in {"{}", "nan", "None"}:
-            return False
-        try:
-            parsed = json.loads(dim_value)
-        except Exception:
-            return False
-        if not isinstance(parsed, dict) or not parsed:
-            return False
-        for key in parsed.keys():
-            if not any(str(key).endswith(suffix) for suffix in self._ALLOWED_DIMENSION_SUFFIXES):
-                return False
-        return True
+        return _dimension_allowed(dim_value, tuple(self._ALLOWED_DIMENSION_SUFFIXES))
 
     def _infer_standard(self, facts: pd.DataFrame) -> Optional[str]:
         """Infer the accounting standard from available facts."""
         if "Standard" not in facts.columns:
             return None
 
-        series = facts["Standard"].dropna()
-        if series.empty:
+        counts = facts["Standard"].dropna().value_counts(sort=False)
+        if counts.empty:
             return None
 
-        return series.mode().iloc[0]
+        # Ties resolve to the smallest label like Series.mode; mixed types fall back to string order.
+        tied = counts.index[(counts == counts.max()).to_numpy()].tolist()
+        try:
+            return sorted(tied)[0]
+        except TypeError:
+            return sorted(tied, key=str)[0]
 
     @staticmethod
     def _build_traces(series_defs: Sequence[Dict[str, Any]], keys: Sequence[str]) -> List[Dict[str, Any]]:
@@ -834,24 +953,18 @@ class FinancialAnalyzer:
     @staticmethod
     def _build_portfolio_traces(series_defs: Sequence[Dict[str, Any]], keys: Sequence[str]) -> List[Dict[str, Any]]:
         """Build portfolio trace definitions from series configs."""
-        available_keys = set(keys) if keys else {spec.get("column_name") for spec in series_defs}
-        traces: List[Dict[str, Any]] = []
-        for spec in series_defs:
-            col_name = spec.get("column_name")
-            if not col_name or col_name not in available_keys:
-                continue
-            trace = {
-                "col": col_name,
-                "name": spec.get("display_name", col_name),
+        available_keys = frozenset(keys) if keys else frozenset(spec.get("column_name") for spec in series_defs)
+        return [
+            {
+                "col": spec["column_name"],
+                "name": spec.get("display_name", spec["column_name"]),
                 "color_key": spec.get("color_key", "navy"),
                 "chart_type": spec.get("chart_type", "area"),
+                **{option: spec[option] for option in ("line_width", "marker_size") if option in spec},
             }
-            if "line_width" in spec:
-                trace["line_width"] = spec["line_width"]
-            if "marker_size" in spec:
-                trace["marker_size"] = spec["marker_size"]
-            traces.append(trace)
-        return traces
+            for spec in series_defs
+            if spec.get("column_name") and spec["column_name"] in available_keys
+        ]
 
     @staticmethod
     def _get_period_columns(df: pd.DataFrame) -> List[str]:
@@ -866,30 +979,33 @@ class FinancialAnalyzer:
         """Return the latest period label."""
         if not period_cols:
             return None
-        parsed = []
-        for col in period_cols:
-            match = re.match(r"(\\d{4}-\\d{2}-\\d{2})-(\\d{4}-\\d{2}-\\d{2})", str(col))
-            if match:
-                parsed.append((col, match.group(2)))
-        if parsed:
-            return sorted(parsed, key=lambda x: x[1])[-1][0]
+        ends = pd.Series([str(col) for col in period_cols], dtype=object).str.extract(_PERIOD_DATE_RE)[1].dropna()
+        if not ends.empty:
+            # ISO dates order lexically; the stable sort keeps the last column among equal end dates.
+            return period_cols[ends.sort_values(kind="stable").index[-1]]
         return sorted(period_cols)[-1]
 
+    @staticmethod
+    def _period_rows_by_key(df_wide: pd.DataFrame, period_cols: Sequence[str]) -> pd.DataFrame:
+        """Index the period columns by canonical_key, keeping the first row per key."""
+        return df_wide.drop_duplicates(subset="canonical_key").set_index("canonical_key")[list(period_cols)]
+
     def _build_trend_dataframe(self, df_wide: pd.DataFrame, series_defs: Sequence[Dict[str, Any]]) -> pd.DataFrame:
         """Build a trend table with period labels as rows and metrics as columns."""
         if df_wide is None or df_wide.empty:
             cols = ["period_label"] + [spec["column_name"] for spec in series_defs]
             return pd.DataFrame(columns=cols)
         period_cols = self._get_period_columns(df_wide)
-        data: Dict[str, List[Any]] = {"period_label": period_cols}
+        rows = self._period_rows_by_key(df_wide, period_cols)
+        present = list(dict.fromkeys(spec["canonical_key"] for spec in series_defs if spec["canonical_key"] in rows.index))
+        # One block fetch for all requested rows; numeric tables come back as a float matrix.
+        values = dict(zip(present, rows.loc[present].to_numpy()))
+        data: Dict[str, Any] = {"period_label": period_cols}
         for spec in series_defs:
-            row = df_wide[df_wide["canonical_key"] == spec["canonical_key"]]
-            if row.empty:
-                data[spec["column_name"]] = [None] * len(period_cols)
-                continue
-            row = row.iloc[0]
-            data[spec["column_name"]] = [row.get(col) for col in period_cols]
-        return pd.DataFrame(data)
+            key = spec["canonical_key"]
+            data[spec["column_name"]] = values[key] if key in values else [None] * len(period_cols)
+        # Mixed-dtype tables yield object rows; infer per column as the list-based build did.
+        return pd.DataFrame(data).infer_objects()
 
     def _build_snapshot_dataframe(
         self,
@@ -902,48 +1018,37 @@ class FinancialAnalyzer:
             cols = ["period_label"] + [spec["column_name"] for spec in series_defs]
             return pd.DataFrame(columns=cols)
         period_cols = self._get_period_columns(df_wide)
+        rows = self._period_rows_by_key(df_wide, period_cols)
         target_period = period_label or self._select_latest_period(period_cols)
 
         if not period_label and period_cols:
             ordered_cols = sorted(period_cols, reverse=True)
-            preferred_row = (
-                df_wide[df_wide["canonical_key"] == "TotalAssets"]
-                if any(spec.get("column_name") == "Total Assets" for spec in series_defs)
-                else pd.DataFrame()
-            )
-            preferred_cols = []
-            if not preferred_row.empty:
-                for col in ordered_cols:
-                    val = pd.to_numeric(preferred_row.iloc[0].get(col), errors="coerce")
-                    if pd.notna(val):
-                        preferred_cols.append(col)
-            if preferred_cols:
-                target_period = preferred_cols[0]
+            populated = rows[ordered_cols].apply(pd.to_numeric, errors="coerce").notna()
+            keys = [spec["canonical_key"] for spec in series_defs if spec["canonical_key"] in populated.index]
+            if any(spec.get("column_name") == "Total Assets" for spec in series_defs) and "TotalAssets" in populated.index:
+                preferred = populated.loc["TotalAssets"]
             else:
-                candidate = None
-                for col in ordered_cols:
-                    for spec in series_defs:
-                        row = df_wide[df_wide["canonical_key"] == spec["canonical_key"]]
-                        if row.empty:
-                            continue
-                        val = pd.to_numeric(row.iloc[0].get(col), errors="coerce")
-                        if pd.notna(val):
-                            candidate = col
-                            break
-                    if candidate:
-                        break
-                if candidate:
-                    target_period = candidate
+                preferred = pd.Series(False, index=ordered_cols)
+            if preferred.any():
+                target_period = preferred.idxmax()
+            elif keys and populated.loc[keys].to_numpy().any():
+                target_period = populated.loc[keys].any(axis=0).idxmax()
 
+        has_target = bool(target_period) and target_period in rows.columns
         row_data: Dict[str, Any] = {"period_label": target_period}
         for spec in series_defs:
-            row = df_wide[df_wide["canonical_key"] == spec["canonical_key"]]
-            if row.empty or not target_period:
-                row_data[spec["column_name"]] = None
-                continue
-            row_data[spec["column_name"]] = row.iloc[0].get(target_period)
+            key = spec["canonical_key"]
+            row_data[spec["column_name"]] = rows.at[key, target_period] if has_target and key in rows.index else None
         return pd.DataFrame([row_data])
 
+    @staticmethod
+    def _key_index(df_wide: pd.DataFrame) -> Dict[str, int]:
+        """Map each canonical_key to the position of its first row."""
+        key_index: Dict[str, int] = {}
+        for position, key in enumerate(df_wide["canonical_key"].tolist()):
+            key_index.setdefault(key, position)
+        return key_index
+
     def _reconcile_balance_sheet(self, df_wide: pd.DataFrame, tolerance: float = 0.03) -> pd.DataFrame:
         """Fill or adjust TotalLiabilities when assets/equity are available but mismatch is large."""
         if df_wide is None or df_wide.empty:
@@ -954,31 +1059,39 @@ class FinancialAnalyzer:
         if not period_cols:
             return df
 
-        assets_row = df[df["canonical_key"] == "TotalAssets"]
-        equity_row = df[df["canonical_key"] == "TotalEquity"]
-        liab_row = df[df["canonical_key"] == "TotalLiabilities"]
-        if assets_row.empty or equity_row.empty:
+        key_index = self._key_index(df)
+        if "TotalAssets" not in key_index or "TotalEquity" not in key_index:
             return df
 
-        if liab_row.empty:
-            new_row = {"canonical_key": "TotalLiabilities", "label": "Total Liabilities (Derived)", "statement": StatementType.BS.value}
-            for col in period_cols:
-                new_row[col] = None
-            df = pd.concat([df, pd.DataFrame([new_row])], ignore_index=True)
-            liab_row = df[df["canonical_key"] == "TotalLiabilities"]
-
-        for col in period_cols:
-            ta = pd.to_numeric(assets_row.iloc[0].get(col), errors="coerce")
-            te = pd.to_numeric(equity_row.iloc[0].get(col), errors="coerce")
-            tl = pd.to_numeric(liab_row.iloc[0].get(col), errors="coerce")
-            if pd.isna(ta) or pd.isna(te):
-                continue
-            derived = ta - te
-            if pd.isna(tl):
-                df.loc[df["canonical_key"] == "TotalLiabilities", col] = derived
-                continue
-            if ta != 0 and abs(ta - (tl + te)) / abs(ta) > tolerance:
-                df.loc[df["canonical_key"] == "TotalLiabilities", col] = derived
+        if "TotalLiabilities" not in key_index:
+            # Enlarge in place; the period columns of the new row start out missing and keep their dtype.
+            df = df.reset_index(drop=True)
+            key_index["TotalLiabilities"] = len(df)
+            df.loc[len(df), ["canonical_key", "label", "statement"]] = [
+                "TotalLiabilities",
+                "Total Liabilities (Derived)",
+                StatementType.BS.value,
+            ]
+
+        period_values = df[period_cols]
+
+        def numeric_row(key: str) -> np.ndarray:
+            return pd.to_numeric(period_values.iloc[key_index[key]], errors="coerce").to_numpy(dtype="float64")
+
+        ta = numeric_row("TotalAssets")
+        te = numeric_row("TotalEquity")
+        tl = numeric_row("TotalLiabilities")
+        derived = ta - te
+        with np.errstate(divide="ignore", invalid="ignore"):
+            mismatch = (ta != 0) & (np.abs(ta - (tl + te)) / np.abs(ta) > tolerance)
+        update = ~np.isnan(derived) & (np.isnan(tl) | mismatch)
+        if update.any():
+            update_cols = [col for col, flag in zip(period_cols, update) if flag]
+            # Text-typed period columns cannot hold the derived floats.
+            text_cols = [col for col in update_cols if pd.api.types.is_string_dtype(df[col].dtype)]
+            if text_cols:
+                df[text_cols] = df[text_cols].astype(object)
+            df.loc[df["canonical_key"] == "TotalLiabilities", update_cols] = derived[update]
 
         return df
 
@@ -989,12 +1102,24 @@ def load_mapping_with_override(
     company_name: Optional[str] = None,
 ) -> Dict[str, Any]:
     """Load mapping from the column definition config and merge a JSON override if provided."""
-    base = ColumnDefinitionConfig.resolve_mapping(standard=standard, company_name=company_name)
     if not override_path:
-        return base
+        return ColumnDefinitionConfig.resolve_mapping(standard=standard, company_name=company_name)
     if not override_path.exists():
         logging.warning("Mapping override not found: %s; using default mapping.", override_path)
-        return base
+        return ColumnDefinitionConfig.resolve_mapping(standard=standard, company_name=company_name)
+
+    mtime_ns = override_path.stat().st_mtime_ns
+    return _override_mapping_config(str(override_path), mtime_ns, standard, company_name).to_dict()
 
-    overlay = ColumnDefinitionConfig.load_json(override_path)
-    return ColumnDefinitionConfig.merge(base, overlay)
+
+@lru_cache(maxsize=64)
+def _override_mapping_config(
+    override_path: str,
+    mtime_ns: int,
+    standard: Optional[str],
+    company_name: Optional[str],
+) -> MappingConfig:
+    """Parse and merge an override file once per path and modification time."""
+    base = ColumnDefinitionConfig.resolve_mapping(standard=standard, company_name=company_name)
+    overlay = ColumnDefinitionConfig.load_json(Path(override_path))
+    return MappingConfig.from_dict(base).merge_over(MappingConfig.from_dict(overlay) if overlay else None)
@@ -1,12 +1,36 @@
 ﻿from __future__ import annotations
 
 import json
+import re
+import sys
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Pattern, Tuple
 
 
-@dataclass(frozen=True)
+@lru_cache(maxsize=None)
+def compile_pattern(pattern: str) -> Pattern[str]:
+    """Compile a candidate regex once (case-insensitive, as facts are matched)."""
+    return re.compile(pattern, re.IGNORECASE)
+
+
+# Backreferences are renumbered inside an alternation and inline global flags are rejected mid-pattern.
+_UNION_UNSAFE_RE = re.compile(r"\\[1-9]|\(\?P=|\(\?[aiLmsux]+\)")
+
+
+@lru_cache(maxsize=None)
+def compile_union(patterns: Tuple[str, ...]) -> Optional[Pattern[str]]:
+    """Compile the alternation of several candidate regexes once, or None if it cannot stand in for them."""
+    if any(_UNION_UNSAFE_RE.search(pattern) for pattern in patterns):
+        return None
+    try:
+        return compile_pattern("|".join(f"(?:{pattern})" for pattern in patterns))
+    except re.error:
+        return None
+
+
+@dataclass(frozen=True, slots=True)
 class CandidateSpec:
     """Typed candidate spec for matching facts."""
 
@@ -14,11 +38,15 @@ class CandidateSpec:
     exact: Optional[str] = None
     regex: Optional[str] = None
     weight: float = 1.0
+    pattern: Optional[Pattern[str]] = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "pattern", compile_pattern(self.regex) if self.regex else None)
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "CandidateSpec":
         return cls(
-            field=str(data.get("field", "")),
+            field=sys.intern(str(data.get("field", ""))),
             exact=data.get("exact"),
             regex=data.get("regex"),
             weight=float(data.get("weight", 1.0) or 1.0),
@@ -33,7 +61,7 @@ class CandidateSpec:
         return payload
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MappingItem:
     """Typed canonical mapping item."""
 
@@ -46,8 +74,8 @@ class MappingItem:
     def from_dict(cls, data: Dict[str, Any]) -> "MappingItem":
         candidates = [CandidateSpec.from_dict(c) for c in data.get("candidates", []) if isinstance(c, dict)]
         return cls(
-            canonical_key=str(data.get("canonical_key", "")),
-            statement=str(data.get("statement", "")),
+            canonical_key=sys.intern(str(data.get("canonical_key", ""))),
+            statement=sys.intern(str(data.get("statement", ""))),
             period_type=data.get("period_type"),
             candidates=candidates,
         )
@@ -67,6 +95,11 @@ class MappingConfig:
     @staticmethod
     def default_mapping() -> Dict[str, Any]:
         """Return the default, standard-agnostic canonical mapping."""
+        return _default_mapping_config().to_dict()
+
+    @staticmethod
+    def _default_mapping_data() -> Dict[str, Any]:
+        """Build the literal default mapping; use default_mapping() for a parsed copy."""
         data = {
             "version": 1,
             "items": [
@@ -82,8 +115,8 @@ class MappingConfig:
                         {"field": "element", "exact": "Revenue", "weight": 3.0},
                         {"field": "element", "regex": r"SalesRevenueNet|NetSalesIFRS|NetSales|OperatingRevenue|Revenues|RevenueIFRS", "weight": 2.5},
                         {"field": "element", "exact": "NetSalesSummaryOfBusinessResults", "weight": 1.0},
-                        {"field": "element", "regex": r"OrdinaryIncomeSummaryOfBusinessResults|OperatingRevenue\\d*SummaryOfBusinessResults", "weight": 2.2},
-                        {"field": "label", "regex": r"\\b(Revenue|Net Sales|Sales Revenue|Operating Revenue|Ordinary Income)\\b", "weight": 1.0},
+                        {"field": "element", "regex": r"OrdinaryIncomeSummaryOfBusinessResults|OperatingRevenue\d*SummaryOfBusinessResults", "weight": 2.2},
+                        {"field": "label", "regex": r"\b(Revenue|Net Sales|Sales Revenue|Operating Revenue|Ordinary Income)\b", "weight": 1.0},
                     ],
                 },
                 {
@@ -327,7 +360,7 @@ class MappingConfig:
                     "period_type": "instant",
                     "candidates": [
                         {"field": "element", "regex": r"(?<!Non)(?<!Other)CurrentAssets|AssetsCurrent", "weight": 2.5},
-                        {"field": "label", "regex": r"\\bCurrent Assets\\b", "weight": 1.0},
+                        {"field": "label", "regex": r"\bCurrent Assets\b", "weight": 1.0},
                     ],
                 },
                 {
@@ -345,7 +378,7 @@ class MappingConfig:
                     "period_type": "instant",
                     "candidates": [
                         {"field": "element", "regex": r"(?<!Other)NonCurrentAssets|(?<!Other)NoncurrentAssets|AssetsNoncurrent", "weight": 2.5},
-                        {"field": "label", "regex": r"\\bNon-?Current Assets\\b|\\bNoncurrent Assets\\b", "weight": 1.0},
+                        {"field": "label", "regex": r"\bNon-?Current Assets\b|\bNoncurrent Assets\b", "weight": 1.0},
                     ],
                 },
                 {
@@ -373,7 +406,7 @@ class MappingConfig:
                     "candidates": [
                         {"field": "element", "exact": "TotalCurrentLiabilitiesIFRS", "weight": 3.0},
                         {"field": "element", "regex": r"(?<!Non)(?<!Other)CurrentLiabilities|LiabilitiesCurrent", "weight": 2.5},
-                        {"field": "label", "regex": r"\\bCurrent Liabilities\\b", "weight": 1.0},
+                        {"field": "label", "regex": r"\bCurrent Liabilities\b", "weight": 1.0},
                     ],
                 },
                 {
@@ -393,7 +426,7 @@ class MappingConfig:
                         {"field": "element", "exact": "NonCurrentLiabilitiesIFRS", "weight": 3.0},
                         {"field": "element", "exact": "TotalNonCurrentLiabilitiesIFRS", "weight": 3.0},
                         {"field": "element", "regex": r"(?<!Other)NonCurrentLiabilities|(?<!Other)NoncurrentLiabilities|LiabilitiesNoncurrent", "weight": 2.5},
-                        {"field": "label", "regex": r"\\bNon-?Current Liabilities\\b|\\bNoncurrent Liabilities\\b", "weight": 1.0},
+                        {"field": "label", "regex": r"\bNon-?Current Liabilities\b|\bNoncurrent Liabilities\b", "weight": 1.0},
                     ],
                 },
                 {
@@ -852,7 +885,7 @@ class MappingConfig:
                 },
             ],
         }
-        return MappingConfig.from_dict(data).to_dict()
+        return data
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "MappingConfig":
@@ -889,3 +922,9 @@ class MappingConfig:
         base_config = MappingConfig.from_dict(base)
         overlay_config = MappingConfig.from_dict(overlay) if overlay else None
         return base_config.merge_over(overlay_config).to_dict()
+
+
+@lru_cache(maxsize=1)
+def _default_mapping_config() -> MappingConfig:
+    """Parse the default mapping once per process; to_dict() hands out fresh copies."""
+    return MappingConfig.from_dict(MappingConfig._default_mapping_data())